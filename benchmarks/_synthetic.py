@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+COMPOUNDS = ("SOFT", "MEDIUM", "HARD")
+
+
+def make_session_laps(
+    year: int,
+    event_name: str,
+    session: str = "R",
+    *,
+    n_drivers: int = 20,
+    n_laps: int = 60,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """
+    Synthetic interim laps table shaped like extract_laps_table output.
+
+    Three stints per driver with linear tyre degradation, a fuel effect and noise;
+    the first lap of each later stint is a pit-out lap.
+    """
+    rng = np.random.default_rng(seed)
+    laps = np.tile(np.arange(1, n_laps + 1), n_drivers)
+    drivers = np.repeat([f"D{i:02d}" for i in range(n_drivers)], n_laps)
+    stint = 1 + (laps - 1) * 3 // n_laps
+    stint_start = 1 + (stint - 1) * n_laps // 3
+    tyre_age = laps - stint_start
+    base = 90.0 + rng.normal(0.0, 0.5, size=n_drivers).repeat(n_laps)
+    lap_s = base + 0.05 * tyre_age - 0.06 * laps + rng.normal(0.0, 0.3, size=laps.size)
+
+    pit_out = (tyre_age == 0) & (stint > 1)
+    pit_out_time = pd.Series(pd.NaT, index=range(laps.size), dtype="timedelta64[ns]")
+    pit_out_time[pit_out] = pd.to_timedelta(laps[pit_out] * 90.0, unit="s")
+
+    return pd.DataFrame(
+        {
+            "Year": year,
+            "EventName": event_name,
+            "Session": session,
+            "Driver": drivers,
+            "LapNumber": laps.astype(float),
+            "Stint": stint.astype(float),
+            "Compound": np.asarray(COMPOUNDS)[(stint - 1) % len(COMPOUNDS)],
+            "LapTime": pd.to_timedelta(lap_s, unit="s"),
+            "PitInTime": pd.Series(pd.NaT, index=range(laps.size), dtype="timedelta64[ns]"),
+            "PitOutTime": pit_out_time,
+        }
+    )
+
+
+def session_specs(n_sessions: int) -> list[tuple[int, str, str]]:
+    years = (2020, 2021, 2022, 2023, 2024)
+    return [(years[i % len(years)], f"Event{i // len(years):02d}", "R") for i in range(n_sessions)]
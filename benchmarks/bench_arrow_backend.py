@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+from _synthetic import make_session_laps, session_specs
+import f1laptime.data.dataset_build as dataset_build
+from f1laptime.data.fastf1_loader import SessionSpec
+from f1laptime.data.parquet_io import write_parquet
+from f1laptime.features.group_index import build_group_index
+from f1laptime.features.transforms_arrow import build_next_lap_examples_arrow_indexed, clean_laps_mask_arrow
+from f1laptime.features.transforms_basic import build_next_lap_examples_indexed, clean_laps_mask
+
+
+# The stages build_for_session runs after extracting (and index-sorting) the laps;
+# only these differ between backend="pandas" and backend="arrow".
+
+
+def _pandas_stages(laps: pd.DataFrame, out_path: Path) -> None:
+    index = build_group_index(laps)
+    keep = clean_laps_mask(laps)
+    examples, _ = build_next_lap_examples_indexed(laps[keep].copy(), index.subset(keep), clean_spec=None)
+    write_parquet(examples, out_path, assume_sorted=True)
+
+
+def _arrow_stages(laps: pd.DataFrame, out_path: Path) -> None:
+    index = build_group_index(laps)
+    table = pa.Table.from_pandas(laps, preserve_index=False)
+    keep = clean_laps_mask_arrow(table)
+    examples, _ = build_next_lap_examples_arrow_indexed(table.filter(pa.array(keep)), index.subset(keep), clean_spec=None)
+    write_parquet(examples, out_path, assume_sorted=True)
+
+
+def _build_for_session(laps: pd.DataFrame, out_dir: Path, backend: str) -> Path:
+    # The real entry point, with the FastF1 load replaced by the synthetic table
+    dataset_build.load_session = lambda spec, **kwargs: None
+    dataset_build.extract_laps_table = lambda session, **kwargs: laps
+    paths = dataset_build.BuildPaths(interim_dir=out_dir / "interim", processed_dir=out_dir / "processed")
+    spec = SessionSpec(year=2024, event_name="Bench", session="R")
+    artifacts = dataset_build.build_for_session(spec, paths=paths, backend=backend, write_summaries=False)
+    return artifacts.examples_path
+
+
+def _best_of(fn, repeat: int, *args) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description="pandas vs Arrow backend of build_for_session (indexed path)")
+    p.add_argument("--sessions", type=str, default="10,100,400", help="Comma-separated table sizes in sessions")
+    p.add_argument("--repeat", type=int, default=3)
+    args = p.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        for n_sessions in (int(s) for s in args.sessions.split(",")):
+            laps = pd.concat(
+                [make_session_laps(y, e, s, seed=i) for i, (y, e, s) in enumerate(session_specs(n_sessions))],
+                ignore_index=True,
+            )
+            # build_for_session hands the stages laps in key order
+            laps = build_group_index(laps).take(laps).reset_index(drop=True)
+
+            t_pd = _best_of(_pandas_stages, args.repeat, laps, tmp_dir / "examples_pandas.parquet")
+            t_pa = _best_of(_arrow_stages, args.repeat, laps, tmp_dir / "examples_arrow.parquet")
+            e_pd = _best_of(_build_for_session, args.repeat, laps, tmp_dir / "pandas", "pandas")
+            e_pa = _best_of(_build_for_session, args.repeat, laps, tmp_dir / "arrow", "arrow")
+
+            pd.testing.assert_frame_equal(
+                pd.read_parquet(tmp_dir / "examples_pandas.parquet"),
+                pd.read_parquet(tmp_dir / "examples_arrow.parquet"),
+            )
+            pd.testing.assert_frame_equal(
+                pd.read_parquet(_build_for_session(laps, tmp_dir / "pandas", "pandas")),
+                pd.read_parquet(_build_for_session(laps, tmp_dir / "arrow", "arrow")),
+            )
+            print(
+                f"{len(laps):>9} laps: stages pandas {t_pd:6.3f}s  arrow {t_pa:6.3f}s  x{t_pd / t_pa:4.2f}  |  "
+                f"build_for_session pandas {e_pd:6.3f}s  arrow {e_pa:6.3f}s  x{e_pd / e_pa:4.2f}  (outputs identical)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import argparse
+import multiprocessing as mp
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from _synthetic import make_session_laps, session_specs
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _run_in_memory(interim_dir: Path, out_path: Path) -> tuple[float, float]:
+    from f1laptime.features.transforms_basic import build_next_lap_examples
+
+    base_mb = _peak_rss_mb()
+    t0 = time.perf_counter()
+    laps = pd.concat(
+        [pd.read_parquet(p) for p in sorted(interim_dir.glob("laps_year=*.parquet"))],
+        ignore_index=True,
+    )
+    examples = build_next_lap_examples(laps)
+    examples.to_parquet(out_path, index=False)
+    return time.perf_counter() - t0, _peak_rss_mb() - base_mb
+
+
+def _run_chunked(interim_dir: Path, out_path: Path) -> tuple[float, float]:
+    from f1laptime.data.dataset_build import build_examples_chunked
+
+    base_mb = _peak_rss_mb()
+    t0 = time.perf_counter()
+    build_examples_chunked(interim_dir, out_path, write_summaries=False)
+    return time.perf_counter() - t0, _peak_rss_mb() - base_mb
+
+
+def _child(mode: str, interim_dir: str, out_path: str, queue: mp.Queue) -> None:
+    # Import pandas/pyarrow before taking the baseline so only the build is measured
+    import pyarrow.dataset  # noqa: F401
+
+    import f1laptime.data.dataset_build  # noqa: F401
+
+    run = _run_in_memory if mode == "in_memory" else _run_chunked
+    queue.put(run(Path(interim_dir), Path(out_path)))
+
+
+def _measure(mode: str, interim_dir: Path, out_path: Path) -> tuple[float, float]:
+    ctx = mp.get_context("spawn")
+    queue = ctx.Queue()
+    proc = ctx.Process(target=_child, args=(mode, str(interim_dir), str(out_path), queue))
+    proc.start()
+    result = queue.get()
+    proc.join()
+    return result
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description="In-memory vs chunked examples build: time and peak RSS")
+    p.add_argument("--sessions", type=int, default=100)
+    p.add_argument("--drivers", type=int, default=20)
+    p.add_argument("--laps", type=int, default=300)
+    p.add_argument(
+        "--max-ratio",
+        type=float,
+        default=2.0,
+        help="Allowed chunked peak RSS as a multiple of a one-session build (default: %(default)s)",
+    )
+    args = p.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        interim_dir = Path(tmp) / "interim"
+        interim_dir.mkdir()
+        for i, (year, event, session) in enumerate(session_specs(args.sessions)):
+            laps = make_session_laps(year, event, session, n_drivers=args.drivers, n_laps=args.laps, seed=i)
+            laps.to_parquet(interim_dir / f"laps_year={year}_event={event}_session={session}.parquet", index=False)
+
+        # Baseline: the chunked build over the largest session alone
+        single_dir = Path(tmp) / "single"
+        single_dir.mkdir()
+        largest = max(interim_dir.glob("laps_year=*.parquet"), key=lambda f: f.stat().st_size)
+        (single_dir / largest.name).symlink_to(largest)
+
+        results = {"single": _measure("chunked", single_dir, Path(tmp) / "examples_single.parquet")}
+        for mode in ("in_memory", "chunked"):
+            out_path = Path(tmp) / f"examples_{mode}.parquet"
+            results[mode] = _measure(mode, interim_dir, out_path)
+        for mode, label in (("single", "1 session"), ("in_memory", "in_memory"), ("chunked", "chunked")):
+            secs, peak_mb = results[mode]
+            print(f"{label:>10}: {secs:7.2f}s  peak RSS +{peak_mb:8.1f} MiB")
+
+        a = pd.read_parquet(Path(tmp) / "examples_in_memory.parquet")
+        b = pd.read_parquet(Path(tmp) / "examples_chunked.parquet")
+        pd.testing.assert_frame_equal(a, b)
+        print(f"outputs identical ({len(a)} rows)")
+
+        assert results["chunked"][1] < results["in_memory"][1], "chunked build should use less peak memory"
+        # Bounded by the largest session, not the history: a constant multiple of one session
+        # (what remains is the output file's per-row-group footer metadata, ~tens of KiB per session)
+        ratio = results["chunked"][1] / max(results["single"][1], 1.0)
+        print(f"chunked / 1 session peak: x{ratio:.2f}")
+        assert ratio <= args.max_ratio, f"chunked peak grows with history (x{ratio:.2f} of one session)"
+
+
+if __name__ == "__main__":
+    main()
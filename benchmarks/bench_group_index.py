@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import argparse
+import time
+
+import pandas as pd
+
+from _synthetic import make_session_laps, session_specs
+from f1laptime.data.contracts import DRIVER_KEY_COLS, LAP_SORT_COLS
+from f1laptime.features.group_index import build_group_index
+
+GROUP_COLS = list(DRIVER_KEY_COLS)
+LAGS = (1, 2, 3)
+WINDOW = 5
+
+
+def _pandas_stages(df: pd.DataFrame) -> None:
+    # Each stage sorts / groups on its own, as independent pandas code would
+    df = df.sort_values(list(LAP_SORT_COLS))
+    for k in LAGS:
+        df[f"lag_{k}"] = df.groupby(GROUP_COLS, sort=False)["LapTime_s"].shift(k)
+    df["roll"] = (
+        df.groupby(GROUP_COLS, sort=False)["LapTime_s"].rolling(WINDOW, min_periods=1).mean().droplevel([0, 1, 2, 3])
+    )
+    df["next"] = df.groupby(GROUP_COLS, sort=False)["LapTime_s"].shift(-1)
+    df.groupby(GROUP_COLS, sort=False)["LapTime_s"].mean()
+
+
+def _index_stages(df: pd.DataFrame, index) -> None:
+    y = index.to_sorted(df["LapTime_s"].to_numpy())
+    for k in LAGS:
+        index.shift(y, k)
+    index.rolling_mean(y, WINDOW)
+    index.shift(y, -1)
+    index.reduce(y, how="mean")
+
+
+def _timed(fn, *args) -> float:
+    t0 = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - t0
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description="Grouped transforms: pandas groupby vs a shared GroupIndex")
+    p.add_argument("--sessions", type=str, default="10,40,160,640", help="Comma-separated table sizes in sessions")
+    args = p.parse_args()
+
+    print(f"{'rows':>9} {'index build':>12} {'index stages':>13} {'pandas stages':>14} {'ns/row (index)':>15}")
+    for n_sessions in (int(s) for s in args.sessions.split(",")):
+        df = pd.concat(
+            [make_session_laps(y, e, s, seed=i) for i, (y, e, s) in enumerate(session_specs(n_sessions))],
+            ignore_index=True,
+        )
+        df = df.sample(frac=1.0, random_state=0, ignore_index=True)
+        df["LapTime_s"] = df["LapTime"].dt.total_seconds()
+
+        t_build = _timed(build_group_index, df)
+        index = build_group_index(df)
+        t_index = _timed(_index_stages, df, index)
+        t_pandas = _timed(_pandas_stages, df)
+        per_row = 1e9 * (t_build + t_index) / len(df)
+        print(f"{len(df):>9} {t_build:>11.3f}s {t_index:>12.3f}s {t_pandas:>13.3f}s {per_row:>15.1f}")
+
+    print("\nns/row staying flat as rows grow = linear scaling; the build is paid once per table")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from _synthetic import make_session_laps, session_specs
+from f1laptime.data.parquet_io import WRITE_PROFILES, read_laps, write_parquet
+
+
+def _baseline(df: pd.DataFrame, path: Path) -> None:
+    # What every stage did before: unsorted, library defaults
+    df.to_parquet(path, index=False)
+
+
+def _best_of(fn, repeat: int, *args) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description="Parquet layout: write speed, size and selective-read latency")
+    p.add_argument("--sessions", type=int, default=400, help="Sessions in the combined laps file")
+    p.add_argument("--repeat", type=int, default=3)
+    args = p.parse_args()
+
+    specs = session_specs(args.sessions)
+    frames = [make_session_laps(y, e, s, seed=i) for i, (y, e, s) in enumerate(specs)]
+    # Combined files are appended in arbitrary order; shuffle so the baseline is unsorted
+    laps = pd.concat(frames, ignore_index=True).sample(frac=1.0, random_state=0).reset_index(drop=True)
+    year, event, session = specs[len(specs) // 2]
+    driver = "D07"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        writers = {"baseline": _baseline}
+        for name in WRITE_PROFILES:
+            writers[name] = lambda df, path, name=name: write_parquet(df, path, profile=name)
+
+        print(f"{len(laps)} laps, {args.sessions} sessions; read = one driver in one session / one driver overall")
+        for name, fn in writers.items():
+            path = tmp_dir / f"laps_{name}.parquet"
+            t_write = _best_of(fn, args.repeat, laps, path)
+            one = dict(year=year, event_name=event, session=session, driver=driver)
+            t_one = _best_of(lambda: read_laps(path, **one), args.repeat)
+            # Driver alone is not a sort-key prefix: expect no row-group skipping (see read_laps)
+            t_all = _best_of(lambda: read_laps(path, driver=driver), args.repeat)
+            n_rows = len(read_laps(path, **one))
+            pf = pq.ParquetFile(path)
+            print(
+                f"{name:<9} write {len(laps) / t_write / 1e6:5.2f} Mrows/s  "
+                f"size {path.stat().st_size / 2**20:6.2f} MiB  row groups {pf.num_row_groups:>4}  "
+                f"read session+driver {t_one * 1e3:7.2f} ms ({n_rows} rows)  driver {t_all * 1e3:7.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from f1laptime.data.dataset_build import build_examples_chunked
+from f1laptime.data.parquet_io import WRITE_PROFILES
+from f1laptime.features.transforms_basic import BasicExampleSpec, LapCleanSpec
+from f1laptime.features.transforms_stint import StintFeatureSpec
+from f1laptime.settings import DATA_DIR
+
+
+def _parse_int_list(value: str) -> tuple[int, ...]:
+    if not value:
+        return ()
+    items = [part.strip() for part in value.split(",") if part.strip()]
+    return tuple(int(part) for part in items)
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(
+        description="Build one combined next-lap examples parquet from all interim laps, session by session"
+    )
+    p.add_argument("--data-dir", type=str, default="", help="Override base data directory")
+    p.add_argument("--interim-dir", type=str, default="", help="Override interim input directory")
+    p.add_argument("--out", type=str, default="", help="Output parquet (default: processed/examples_next_lap_combined.parquet)")
+    p.add_argument("--sessions-per-chunk", type=int, default=1, help="Sessions held in memory at once (default: 1)")
+    p.add_argument("--lags", type=str, default="1,2,3", help="Comma-separated lag steps (default: 1,2,3)")
+    p.add_argument("--stint-features", action="store_true", help="Add causal per-stint degradation features")
+    p.add_argument(
+        "--fuel-s-per-lap",
+        type=float,
+        default=StintFeatureSpec.fuel_s_per_lap,
+        help="Lap time gained per lap of fuel burned, for fuel correction (default: %(default)s)",
+    )
+    p.add_argument("--min-lap-time-s", type=float, default=None, help="Drop laps below this time (seconds)")
+    p.add_argument("--max-lap-time-s", type=float, default=None, help="Drop laps above this time (seconds)")
+    p.add_argument("--no-summaries", action="store_true", help="Do not write the .summary.json QA sidecar")
+    p.add_argument(
+        "--write-profile",
+        type=str,
+        default="fast",
+        choices=sorted(WRITE_PROFILES),
+        help="Parquet layout: fast (quick writes) or small (compact files) (default: fast)",
+    )
+    args = p.parse_args()
+
+    data_dir = Path(args.data_dir) if args.data_dir else DATA_DIR
+    interim_dir = Path(args.interim_dir) if args.interim_dir else data_dir / "interim"
+    out_path = Path(args.out) if args.out else data_dir / "processed" / "examples_next_lap_combined.parquet"
+
+    examples_spec = BasicExampleSpec(
+        lags=_parse_int_list(args.lags),
+        stint=StintFeatureSpec(fuel_s_per_lap=args.fuel_s_per_lap) if args.stint_features else None,
+    )
+    clean_spec = LapCleanSpec(min_lap_time_s=args.min_lap_time_s, max_lap_time_s=args.max_lap_time_s)
+
+    path = build_examples_chunked(
+        interim_dir,
+        out_path,
+        examples_spec=examples_spec,
+        clean_spec=clean_spec,
+        sessions_per_chunk=args.sessions_per_chunk,
+        write_summaries=not args.no_summaries,
+        write_profile=args.write_profile,
+    )
+    print(f"Combined examples: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,9 @@ from pathlib import Path
 
 from f1laptime.data.dataset_build import BuildPaths, build_for_session
 from f1laptime.data.fastf1_loader import SessionSpec
+from f1laptime.data.parquet_io import WRITE_PROFILES
 from f1laptime.features.transforms_basic import BasicExampleSpec, LapCleanSpec
+from f1laptime.features.transforms_stint import StintFeatureSpec
 from f1laptime.settings import DATA_DIR
 
 
@@ -40,6 +42,17 @@ def main() -> None:
         default="1,2,3",
         help="Comma-separated lag steps for next_lap examples (default: 1,2,3)",
     )
+    p.add_argument(
+        "--stint-features",
+        action="store_true",
+        help="Add causal per-stint degradation and fuel-corrected lap time features to examples",
+    )
+    p.add_argument(
+        "--fuel-s-per-lap",
+        type=float,
+        default=StintFeatureSpec.fuel_s_per_lap,
+        help="Lap time gained per lap of fuel burned, for fuel correction (default: %(default)s)",
+    )
     p.add_argument("--extra-cols", type=str, default="", help="Extra lap columns to keep (comma-separated)")
     p.add_argument("--data-dir", type=str, default="", help="Override base data directory")
     p.add_argument("--interim-dir", type=str, default="", help="Override interim output directory")
@@ -59,6 +72,21 @@ def main() -> None:
     p.add_argument("--with-telemetry", action="store_true", help="Load telemetry (slow)")
     p.add_argument("--no-weather", action="store_true", help="Skip weather data")
     p.add_argument("--no-messages", action="store_true", help="Skip race control messages")
+    p.add_argument(
+        "--backend",
+        type=str,
+        default="pandas",
+        choices=["pandas", "arrow"],
+        help="Transform backend for cleaning and examples (default: pandas)",
+    )
+    p.add_argument("--no-summaries", action="store_true", help="Do not write .summary.json QA sidecars")
+    p.add_argument(
+        "--write-profile",
+        type=str,
+        default="fast",
+        choices=sorted(WRITE_PROFILES),
+        help="Parquet layout: fast (quick writes) or small (compact files) (default: fast)",
+    )
     args = p.parse_args()
 
     spec = SessionSpec(year=args.year, event_name=args.event, session=args.session)  # type: ignore[arg-type]
@@ -74,7 +102,8 @@ def main() -> None:
 
     lags = _parse_int_list(args.lags)
     extra_cols = _parse_str_list(args.extra_cols)
-    examples_spec = BasicExampleSpec(lags=lags) if args.task == "next_lap" else BasicExampleSpec()
+    stint_spec = StintFeatureSpec(fuel_s_per_lap=args.fuel_s_per_lap) if args.stint_features else None
+    examples_spec = BasicExampleSpec(lags=lags, stint=stint_spec) if args.task == "next_lap" else BasicExampleSpec()
 
     clean_spec = LapCleanSpec(
         drop_pit_laps=not args.keep_pit_laps,
@@ -97,6 +126,9 @@ def main() -> None:
         with_telemetry=args.with_telemetry,
         with_weather=not args.no_weather,
         with_messages=not args.no_messages,
+        write_summaries=not args.no_summaries,
+        backend=args.backend,
+        write_profile=args.write_profile,
     )
     print(f"Interim laps:       {artifacts.laps_path}")
     if artifacts.clean_laps_path is not None:
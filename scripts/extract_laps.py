@@ -6,6 +6,7 @@ from pathlib import Path
 from f1laptime.data.fastf1_loader import SessionSpec, load_session
 from f1laptime.data.laps_extract import extract_laps_table
 from f1laptime.data.contracts import validate_laps_table
+from f1laptime.data.parquet_io import WRITE_PROFILES, write_parquet
 
 
 def main() -> None:
@@ -14,6 +15,13 @@ def main() -> None:
     p.add_argument("--event", type=str, required=True)
     p.add_argument("--session", type=str, required=True)
     p.add_argument("--out", type=str, required=True)
+    p.add_argument(
+        "--write-profile",
+        type=str,
+        default="fast",
+        choices=sorted(WRITE_PROFILES),
+        help="Parquet layout: fast (quick writes) or small (compact files) (default: fast)",
+    )
     args = p.parse_args()
 
     spec = SessionSpec(year=args.year, event_name=args.event, session=args.session)  # type: ignore[arg-type]
@@ -24,7 +32,7 @@ def main() -> None:
 
     out_path = Path(args.out)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    laps.to_parquet(out_path, index=False)
+    write_parquet(laps, out_path, profile=args.write_profile)
     print(f"Wrote: {out_path}")
 
 
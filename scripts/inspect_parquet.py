@@ -5,6 +5,8 @@ from pathlib import Path
 
 import pandas as pd
 
+from f1laptime.data.summaries import merge_summaries, read_summary_sidecar, summaries_to_frame, summary_sidecar_path
+
 
 def _print_df_info(df: pd.DataFrame, name: str, max_cols: int = 40) -> None:
     print("\n" + "=" * 80)
@@ -68,6 +70,16 @@ def _print_df_info(df: pd.DataFrame, name: str, max_cols: int = 40) -> None:
             print(f"WARNING: {extreme} rows have |next-current| > 30s (check pit/flags policy)")
 
 
+def _print_sidecar_summary(path: Path) -> None:
+    sidecar = summary_sidecar_path(path)
+    if not sidecar.exists():
+        return
+    by = ("Compound",)
+    table = summaries_to_frame(merge_summaries(read_summary_sidecar(sidecar), by=by), by=by)
+    print(f"\nSidecar summary ({sidecar.name}):")
+    with pd.option_context("display.max_columns", 200, "display.width", 160):
+        print(table.to_string(index=False))
+
 
 def main() -> None:
     p = argparse.ArgumentParser(description="Inspect parquet datasets generated by the pipeline")
@@ -88,6 +100,7 @@ def main() -> None:
             raise SystemExit(f"File not found: {path}")
         df = pd.read_parquet(path)
         _print_df_info(df, name=str(path))
+        _print_sidecar_summary(path)
         return
 
     # Otherwise: find the latest in interim and processed
@@ -98,6 +111,7 @@ def main() -> None:
         latest_interim = interim[-1]
         df_i = pd.read_parquet(latest_interim)
         _print_df_info(df_i, name=f"Latest interim: {latest_interim}")
+        _print_sidecar_summary(latest_interim)
     else:
         print("No interim parquet files found in data/interim/")
 
@@ -105,6 +119,7 @@ def main() -> None:
         latest_processed = processed[-1]
         df_p = pd.read_parquet(latest_processed)
         _print_df_info(df_p, name=f"Latest processed: {latest_processed}")
+        _print_sidecar_summary(latest_processed)
     else:
         print("No processed parquet files found in data/processed/")
 
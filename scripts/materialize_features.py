@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from f1laptime.features.registry import DEFAULT_REGISTRY
+from f1laptime.features.store import FeatureStore
+from f1laptime.settings import DATA_DIR, FEATURE_STORE_DIR
+
+
+def _parse_str_list(value: str) -> tuple[str, ...]:
+    if not value:
+        return ()
+    return tuple(part.strip() for part in value.split(",") if part.strip())
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description="Materialize registered features for every examples partition")
+    p.add_argument("--features", type=str, default="", help="Comma-separated feature names")
+    p.add_argument("--list", action="store_true", help="List registered features and exit")
+    p.add_argument("--data-dir", type=str, default="", help="Override base data directory")
+    p.add_argument("--processed-dir", type=str, default="", help="Override processed input directory")
+    p.add_argument("--store-dir", type=str, default="", help="Override feature store directory")
+    p.add_argument(
+        "--pattern",
+        type=str,
+        default="examples_next_lap_year=*.parquet",
+        help="Glob of base partitions inside processed/ (default: %(default)s)",
+    )
+    args = p.parse_args()
+
+    if args.list:
+        for name in DEFAULT_REGISTRY.names():
+            f = DEFAULT_REGISTRY[name]
+            print(f"{name:<28} v{f.version}  deps={list(f.deps)}  {f.description}")
+        return
+
+    features = _parse_str_list(args.features)
+    if not features:
+        raise SystemExit("Nothing to do: pass --features (see --list)")
+
+    data_dir = Path(args.data_dir) if args.data_dir else DATA_DIR
+    processed_dir = Path(args.processed_dir) if args.processed_dir else data_dir / "processed"
+    store_dir = Path(args.store_dir) if args.store_dir else FEATURE_STORE_DIR
+
+    base_paths = sorted(processed_dir.glob(args.pattern))
+    if not base_paths:
+        raise SystemExit(f"No partitions matching {args.pattern} in {processed_dir}")
+
+    stats = FeatureStore(store_dir).materialize(base_paths, features)
+    print(f"Partitions: {len(base_paths)}  store: {store_dir}")
+    for name in sorted(set(stats.computed) | set(stats.cached)):
+        print(f"{name:<28} computed={stats.computed.get(name, 0):<5} cached={stats.cached.get(name, 0)}")
+
+
+if __name__ == "__main__":
+    main()
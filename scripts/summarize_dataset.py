@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+import pandas as pd
+
+from f1laptime.data.summaries import (
+    SUMMARY_SUFFIX,
+    merge_summaries,
+    read_summaries,
+    summaries_to_frame,
+)
+from f1laptime.settings import DATA_DIR
+
+
+def _parse_str_list(value: str) -> tuple[str, ...]:
+    if not value:
+        return ()
+    return tuple(part.strip() for part in value.split(",") if part.strip())
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(
+        description="Dataset-wide lap time QA by merging .summary.json sidecars (no parquet reads)"
+    )
+    p.add_argument("--data-dir", type=str, default="", help="Override base data directory")
+    p.add_argument(
+        "--stage",
+        type=str,
+        default="examples_next_lap",
+        choices=["laps", "laps_clean", "examples_next_lap"],
+        help="Which artifacts to summarize (default: examples_next_lap)",
+    )
+    p.add_argument(
+        "--by",
+        type=str,
+        default="",
+        help="Comma-separated keys to group by, e.g. EventName,Compound (default: dataset-wide)",
+    )
+    args = p.parse_args()
+
+    data_dir = Path(args.data_dir) if args.data_dir else DATA_DIR
+    stage_dir = data_dir / ("interim" if args.stage == "laps" else "processed")
+    # Anchor on "_year=" so that "laps" does not also match "laps_clean_*"
+    pattern = f"{args.stage}_year=*{SUMMARY_SUFFIX}"
+    paths = sorted(stage_dir.glob(pattern))
+    if not paths:
+        raise SystemExit(f"No {SUMMARY_SUFFIX} sidecars found for stage '{args.stage}' in {stage_dir}")
+
+    by = _parse_str_list(args.by)
+    merged = merge_summaries(read_summaries(paths), by=by)
+    table = summaries_to_frame(merged, by=by)
+
+    print(f"Merged {len(paths)} sidecar(s) from {stage_dir}")
+    with pd.option_context("display.max_columns", 200, "display.width", 200, "display.max_rows", 500):
+        print(table.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,12 +4,24 @@ from dataclasses import dataclass
 from typing import Iterable
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
 
 # ---- Contracts (v0) ----
 # Keep the contracts small and enforce only what we truly need.
 
 
+# Key columns, outermost first. Every grouped transform, the group index, the
+# parquet sort order and the feature store join on these.
+SESSION_KEY_COLS: tuple[str, ...] = ("Year", "EventName", "Session")
+DRIVER_KEY_COLS: tuple[str, ...] = (*SESSION_KEY_COLS, "Driver")
+STINT_KEY_COLS: tuple[str, ...] = (*DRIVER_KEY_COLS, "Stint")
+LAP_SORT_COLS: tuple[str, ...] = (*DRIVER_KEY_COLS, "LapNumber")
+# Columns every feature may rely on without declaring them.
+FEATURE_KEY_COLS: tuple[str, ...] = (*LAP_SORT_COLS, "Stint")
+
+
 LAPS_REQUIRED_COLUMNS: tuple[str, ...] = (
     "Year",
     "EventName",
@@ -61,3 +73,21 @@ def validate_examples_table(df: pd.DataFrame) -> None:
         raise ValueError("examples_table: LapTime_s contains NaN")
     if df["LapTime_next_s"].isna().any():
         raise ValueError("examples_table: LapTime_next_s contains NaN")
+
+
+def _has_missing(table: pa.Table, col: str) -> bool:
+    return pc.any(pc.is_null(table[col], nan_is_null=True)).as_py() or False
+
+
+def validate_examples_arrow(table: pa.Table) -> None:
+    """
+    Arrow counterpart of validate_examples_table.
+    """
+    missing = [c for c in EXAMPLES_REQUIRED_COLUMNS if c not in table.column_names]
+    if missing:
+        raise ValueError(f"examples_table: missing required columns: {missing}")
+
+    if _has_missing(table, "LapTime_s"):
+        raise ValueError("examples_table: LapTime_s contains NaN")
+    if _has_missing(table, "LapTime_next_s"):
+        raise ValueError("examples_table: LapTime_next_s contains NaN")
@@ -2,18 +2,33 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Sequence
+from typing import Iterator, Literal, Sequence
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 
-from f1laptime.data.contracts import validate_examples_table, validate_laps_table
+from f1laptime.data.contracts import SESSION_KEY_COLS, validate_examples_arrow, validate_examples_table, validate_laps_table
 from f1laptime.data.fastf1_loader import SessionSpec, load_session
 from f1laptime.data.laps_extract import extract_laps_table
+from f1laptime.data.parquet_io import DEFAULT_WRITE_PROFILE, ParquetAppender, WriteProfile, write_parquet
+from f1laptime.data.summaries import (
+    PartitionSummary,
+    SummarySpec,
+    summarize_frame,
+    write_summary_partitions,
+    write_summary_sidecar,
+)
+from f1laptime.features.group_index import GroupIndex, build_group_index, save_group_index
+from f1laptime.features.transforms_arrow import build_next_lap_examples_arrow_indexed, clean_laps_mask_arrow
 from f1laptime.features.transforms_basic import (
     BasicExampleSpec,
     LapCleanSpec,
     build_next_lap_examples,
-    clean_laps,
+    build_next_lap_examples_indexed,
+    clean_laps_mask,
 )
 
 
@@ -30,6 +45,15 @@ class BuildArtifacts:
     clean_laps_path: Path | None
 
 
+TransformBackend = Literal["pandas", "arrow"]
+
+
+def _filter_rows(table: pd.DataFrame | pa.Table, keep) -> pd.DataFrame | pa.Table:
+    if isinstance(table, pa.Table):
+        return table.filter(pa.array(keep))
+    return table[keep].copy()
+
+
 def build_for_session(
     spec: SessionSpec,
     *,
@@ -43,11 +67,44 @@ def build_for_session(
     with_telemetry: bool = False,
     with_weather: bool = True,
     with_messages: bool = True,
+    write_summaries: bool = True,
+    summary_spec: SummarySpec = SummarySpec(),
+    backend: TransformBackend = "pandas",
+    write_group_index: bool = True,
+    write_profile: str | WriteProfile = DEFAULT_WRITE_PROFILE,
 ) -> BuildArtifacts:
     """
     Builds (1) interim laps table and (2) processed tables (clean laps, examples).
     Returns paths to the parquet files that were written.
+
+    If write_summaries is set, each parquet gets a small `.summary.json` sidecar
+    with mergeable QA sketches (see f1laptime.data.summaries).
+
+    backend="arrow" runs cleaning and example building on Arrow tables
+    (f1laptime.features.transforms_arrow); the output is the same.
+
+    The laps are sorted and grouped once (GroupIndex); cleaning and example
+    building reuse that index, and with write_group_index it is saved next to
+    each parquet as `.groups.npz` for later stages.
+
+    Every parquet is written key-sorted through f1laptime.data.parquet_io with the
+    given write_profile ("fast" or "small").
     """
+    if backend == "pandas":
+        clean_mask_fn, examples_fn, validate_examples_fn = (
+            clean_laps_mask,
+            build_next_lap_examples_indexed,
+            validate_examples_table,
+        )
+    elif backend == "arrow":
+        clean_mask_fn, examples_fn, validate_examples_fn = (
+            clean_laps_mask_arrow,
+            build_next_lap_examples_arrow_indexed,
+            validate_examples_arrow,
+        )
+    else:
+        raise ValueError(f"Unknown backend: {backend}")
+
     paths.interim_dir.mkdir(parents=True, exist_ok=True)
     paths.processed_dir.mkdir(parents=True, exist_ok=True)
 
@@ -73,31 +130,161 @@ def build_for_session(
     if output_tag:
         base = f"{base}_tag={output_tag}"
 
+    # Persist laps in key order so every artifact (and its saved index) is sorted
+    laps_index = build_group_index(laps)
+    laps = laps_index.take(laps).reset_index(drop=True)
+    laps_index = laps_index.sorted()
+
     laps_path = paths.interim_dir / f"laps_{base}.parquet"
-    laps.to_parquet(laps_path, index=False)
+    write_parquet(laps, laps_path, profile=write_profile, assume_sorted=True)
+    if write_summaries:
+        write_summary_sidecar(laps, laps_path, spec=summary_spec)
+    if write_group_index:
+        save_group_index(laps_index, laps_path)
     clean_laps_path: Path | None = None
     examples_path: Path | None = None
 
-    clean_laps_df: pd.DataFrame | None = None
+    # FastF1 hands us pandas; the Arrow backend converts once and stays in Arrow
+    source = pa.Table.from_pandas(laps, preserve_index=False) if backend == "arrow" else laps
+
+    clean_laps_df: pd.DataFrame | pa.Table | None = None
+    clean_index: GroupIndex | None = None
     if save_clean_laps or (examples_task and examples_task != "none"):
-        clean_laps_df = clean_laps(laps, spec=clean_spec)
+        keep = clean_mask_fn(source, spec=clean_spec)
+        clean_laps_df = _filter_rows(source, keep)
+        clean_index = laps_index.subset(keep)
 
     if save_clean_laps and clean_laps_df is not None:
         clean_laps_path = paths.processed_dir / f"laps_clean_{base}.parquet"
-        clean_laps_df.to_parquet(clean_laps_path, index=False)
+        write_parquet(clean_laps_df, clean_laps_path, profile=write_profile, assume_sorted=True)
+        if write_summaries:
+            write_summary_sidecar(clean_laps_df, clean_laps_path, spec=summary_spec)
+        if write_group_index:
+            save_group_index(clean_index, clean_laps_path)
 
     if examples_task and examples_task != "none":
         if examples_task != "next_lap":
             raise ValueError(f"Unknown examples_task: {examples_task}")
-        if clean_laps_df is None:
-            clean_laps_df = clean_laps(laps, spec=clean_spec)
-        examples = build_next_lap_examples(clean_laps_df, spec=examples_spec, clean_spec=None)
-        validate_examples_table(examples)
+        examples, examples_index = examples_fn(clean_laps_df, clean_index, spec=examples_spec, clean_spec=None)
+        validate_examples_fn(examples)
         examples_path = paths.processed_dir / f"examples_{examples_task}_{base}.parquet"
-        examples.to_parquet(examples_path, index=False)
+        write_parquet(examples, examples_path, profile=write_profile, assume_sorted=True)
+        if write_summaries:
+            write_summary_sidecar(examples, examples_path, spec=summary_spec)
+        if write_group_index:
+            save_group_index(examples_index, examples_path)
 
     return BuildArtifacts(
         laps_path=laps_path,
         examples_path=examples_path,
         clean_laps_path=clean_laps_path,
     )
+
+
+def _laps_dataset(source: Path | Sequence[Path]) -> ds.FileSystemDataset:
+    if isinstance(source, Path):
+        if source.is_dir():
+            files = sorted(source.glob("laps_year=*.parquet"))
+        else:
+            files = [source]
+    else:
+        files = list(source)
+    if not files:
+        raise ValueError(f"No laps parquet files found in {source}")
+    # A session with an all-missing column stores it as type null; unify so it
+    # takes the type the other files have instead of the first file's
+    schema = pa.unify_schemas([pq.read_schema(f) for f in files])
+    return ds.dataset([str(f) for f in files], schema=schema, format="parquet")
+
+
+def _examples_table(examples: pd.DataFrame, laps_schema: pa.Schema) -> pa.Table:
+    """
+    examples as Arrow, with columns that are all missing in this chunk typed like
+    the laps columns they come from (so the first chunk does not fix them to null).
+    """
+    table = pa.Table.from_pandas(examples, preserve_index=False)
+    fields = [
+        laps_schema.field(f.name) if pa.types.is_null(f.type) and f.name in laps_schema.names else f
+        for f in table.schema
+    ]
+    return table.cast(pa.schema(fields, metadata=table.schema.metadata))
+
+
+def _session_files(dataset: ds.FileSystemDataset) -> dict[tuple, list[str]]:
+    """
+    Map each (Year, EventName, Session) key to the files that contain it.
+    Only the key columns are read, and only paths are kept (no per-file metadata),
+    so the map stays small however many files there are.
+    """
+    out: dict[tuple, list[str]] = {}
+    for path in dataset.files:
+        keys = pq.read_table(path, columns=list(SESSION_KEY_COLS)).group_by(list(SESSION_KEY_COLS)).aggregate([])
+        for key in zip(*(keys.column(c).to_pylist() for c in SESSION_KEY_COLS)):
+            out.setdefault(key, []).append(path)
+    return out
+
+
+def _iter_session_chunks(dataset: ds.FileSystemDataset, sessions_per_chunk: int) -> Iterator[pd.DataFrame]:
+    files = _session_files(dataset)
+    # Sorted like build_next_lap_examples sorts rows, so appended chunks stay in order
+    keys = sorted(files)
+    for i in range(0, len(keys), sessions_per_chunk):
+        chunk = keys[i : i + sessions_per_chunk]
+        expr = None
+        for key in chunk:
+            one = None
+            for col, value in zip(SESSION_KEY_COLS, key):
+                cond = pc.field(col) == value
+                one = cond if one is None else one & cond
+            expr = one if expr is None else expr | one
+        chunk_files = sorted({f for key in chunk for f in files[key]})
+        fragments = [dataset.format.make_fragment(f, dataset.filesystem) for f in chunk_files]
+        tables = [f.to_table(schema=dataset.schema, filter=expr) for f in fragments]
+        yield pa.concat_tables(tables).to_pandas()
+
+
+def build_examples_chunked(
+    laps_source: Path | Sequence[Path],
+    out_path: Path,
+    *,
+    examples_spec: BasicExampleSpec = BasicExampleSpec(),
+    clean_spec: LapCleanSpec = LapCleanSpec(),
+    sessions_per_chunk: int = 1,
+    write_summaries: bool = True,
+    summary_spec: SummarySpec = SummarySpec(),
+    write_profile: str | WriteProfile = DEFAULT_WRITE_PROFILE,
+) -> Path:
+    """
+    Build one combined next-lap examples parquet from many interim laps files.
+
+    Sessions are streamed `sessions_per_chunk` at a time through clean_laps and
+    build_next_lap_examples and appended to out_path, so peak memory is bounded by
+    the largest chunk rather than the whole history. Sessions are processed in
+    sorted key order, so the output rows match the in-memory path on the
+    concatenated laps and the file is key-sorted (see f1laptime.data.parquet_io).
+
+    laps_source is an interim directory (laps_year=*.parquet) or explicit files.
+    """
+    if sessions_per_chunk < 1:
+        raise ValueError("sessions_per_chunk must be >= 1")
+
+    dataset = _laps_dataset(laps_source)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+
+    partitions: list[PartitionSummary] = []
+    with ParquetAppender(out_path, profile=write_profile) as writer:
+        for laps in _iter_session_chunks(dataset, sessions_per_chunk):
+            validate_laps_table(laps)
+            examples = build_next_lap_examples(laps, spec=examples_spec, clean_spec=clean_spec)
+            if examples.empty:
+                continue
+            validate_examples_table(examples)
+            writer.write(_examples_table(examples, dataset.schema))
+            if write_summaries:
+                partitions.extend(summarize_frame(examples, spec=summary_spec))
+
+    if writer.schema is None:
+        raise ValueError("build_examples_chunked: no examples were produced")
+    if write_summaries:
+        write_summary_partitions(partitions, out_path)
+    return out_path
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Sequence
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from f1laptime.data.contracts import LAP_SORT_COLS
+
+
+# ---- Parquet I/O (v1) ----
+# One writer for every pipeline stage: rows sorted by the lap keys, row groups and
+# codecs from a named profile, dictionary encoding, statistics and page indexes,
+# and the sort order recorded in the file so readers can rely on it.
+
+SORT_ORDER_METADATA_KEY = b"f1laptime.sort_order"
+
+
+@dataclass(frozen=True)
+class WriteProfile:
+    """
+    Physical layout of a parquet artifact.
+
+    Smaller row groups let key-filtered reads skip more data; larger ones and a
+    stronger codec give smaller files. Skipping works on a prefix of the sort key:
+    a row group holds many sessions with every driver in each, so a lookup by
+    Driver alone cannot skip any of them in a multi-session file (see read_laps).
+    """
+    name: str
+    compression: str
+    compression_level: int | None
+    row_group_size: int
+    data_page_size: int
+    use_dictionary: bool = True
+    write_statistics: bool = True
+    write_page_index: bool = True
+
+
+WRITE_PROFILES: dict[str, WriteProfile] = {
+    "fast": WriteProfile(
+        name="fast",
+        compression="snappy",
+        compression_level=None,
+        row_group_size=16_384,
+        data_page_size=256 * 1024,
+    ),
+    "small": WriteProfile(
+        name="small",
+        compression="zstd",
+        compression_level=9,
+        row_group_size=131_072,
+        data_page_size=1024 * 1024,
+    ),
+}
+
+DEFAULT_WRITE_PROFILE = "fast"
+
+
+def get_write_profile(profile: str | WriteProfile) -> WriteProfile:
+    if isinstance(profile, WriteProfile):
+        return profile
+    try:
+        return WRITE_PROFILES[profile]
+    except KeyError:
+        raise ValueError(f"Unknown write profile: {profile} (expected one of {sorted(WRITE_PROFILES)})") from None
+
+
+def _to_table(data: pd.DataFrame | pa.Table) -> pa.Table:
+    if isinstance(data, pa.Table):
+        return data
+    return pa.Table.from_pandas(data, preserve_index=False)
+
+
+def _sort_keys(schema: pa.Schema) -> list[str]:
+    # Leading key columns that exist; a gap ends the usable sort prefix
+    keys: list[str] = []
+    for col in LAP_SORT_COLS:
+        if col not in schema.names:
+            break
+        keys.append(col)
+    return keys
+
+
+def _with_sort_metadata(schema: pa.Schema, keys: Sequence[str]) -> pa.Schema:
+    metadata = dict(schema.metadata or {})
+    metadata[SORT_ORDER_METADATA_KEY] = json.dumps(list(keys)).encode()
+    return schema.with_metadata(metadata)
+
+
+def _writer_options(profile: WriteProfile, schema: pa.Schema, keys: Sequence[str]) -> dict:
+    return {
+        "compression": profile.compression,
+        "compression_level": profile.compression_level,
+        "use_dictionary": profile.use_dictionary,
+        "write_statistics": profile.write_statistics,
+        "write_page_index": profile.write_page_index,
+        "data_page_size": profile.data_page_size,
+        "sorting_columns": [pq.SortingColumn(schema.get_field_index(c)) for c in keys] or None,
+    }
+
+
+def write_parquet(
+    data: pd.DataFrame | pa.Table,
+    path: Path,
+    *,
+    profile: str | WriteProfile = DEFAULT_WRITE_PROFILE,
+    assume_sorted: bool = False,
+) -> Path:
+    """
+    Write a pipeline artifact.
+
+    Rows are sorted by the available prefix of LAP_SORT_COLS (stable, nulls last,
+    same order as DataFrame.sort_values) unless assume_sorted says they already are.
+    The key order is recorded as parquet sorting_columns and in schema metadata.
+    """
+    profile = get_write_profile(profile)
+    table = _to_table(data)
+    keys = _sort_keys(table.schema)
+    if keys and not assume_sorted:
+        table = table.sort_by([(c, "ascending") for c in keys])
+    if keys:
+        table = table.replace_schema_metadata(_with_sort_metadata(table.schema, keys).metadata)
+
+    pq.write_table(
+        table,
+        path,
+        row_group_size=profile.row_group_size,
+        **_writer_options(profile, table.schema, keys),
+    )
+    return Path(path)
+
+
+class ParquetAppender:
+    """
+    Streaming counterpart of write_parquet for outputs built chunk by chunk.
+
+    Chunks must arrive already sorted and in key order (the caller guarantees the
+    recorded sort order). The schema is fixed by the first chunk.
+    """
+
+    def __init__(self, path: Path, *, profile: str | WriteProfile = DEFAULT_WRITE_PROFILE) -> None:
+        self.path = Path(path)
+        self.profile = get_write_profile(profile)
+        self._writer: pq.ParquetWriter | None = None
+
+    @property
+    def schema(self) -> pa.Schema | None:
+        return self._writer.schema if self._writer is not None else None
+
+    def write(self, data: pd.DataFrame | pa.Table) -> None:
+        if self._writer is None:
+            table = _to_table(data)
+            keys = _sort_keys(table.schema)
+            if keys:
+                table = table.replace_schema_metadata(_with_sort_metadata(table.schema, keys).metadata)
+            self._writer = pq.ParquetWriter(
+                self.path, table.schema, **_writer_options(self.profile, table.schema, keys)
+            )
+        elif isinstance(data, pa.Table):
+            table = data.cast(self._writer.schema)
+        else:
+            table = pa.Table.from_pandas(data, schema=self._writer.schema, preserve_index=False)
+        self._writer.write_table(table, row_group_size=self.profile.row_group_size)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+    def __enter__(self) -> ParquetAppender:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def file_fingerprint(path: Path) -> str:
+    """
+    Cheap identity of an artifact file (rewritten file -> new fingerprint).
+    Caches derived from a file (feature columns, group index) record it.
+    """
+    st = Path(path).stat()
+    payload = {"name": Path(path).name, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def read_sort_order(path: Path) -> tuple[str, ...]:
+    """
+    Key columns the file is sorted by (empty if it was not written sorted).
+    """
+    metadata = pq.read_schema(path).metadata or {}
+    raw = metadata.get(SORT_ORDER_METADATA_KEY)
+    return tuple(json.loads(raw)) if raw else ()
+
+
+def read_laps(
+    path: Path,
+    *,
+    year: int | None = None,
+    event_name: str | None = None,
+    session: str | None = None,
+    driver: str | None = None,
+    columns: Sequence[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Read the rows matching the given keys. Filters are pushed down to parquet
+    row-group statistics, so on key-sorted files most row groups are skipped when
+    the leading keys (Year, EventName, Session) are given.
+
+    A Driver-only lookup over many sessions still decodes every row group: Driver
+    is the fourth sort key, so each row group spans all drivers. Pass the session
+    keys too, or read per-session files, when that matters.
+    """
+    filters = [
+        (col, "==", value)
+        for col, value in (("Year", year), ("EventName", event_name), ("Session", session), ("Driver", driver))
+        if value is not None
+    ]
+    table = pq.read_table(path, columns=list(columns) if columns is not None else None, filters=filters or None)
+    return table.to_pandas()
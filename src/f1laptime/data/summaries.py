@@ -0,0 +1,423 @@
+from __future__ import annotations
+
+import json
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Mapping, Sequence
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from f1laptime.features.transforms_basic import _lap_time_to_seconds
+
+
+# ---- Summary sketches (v1) ----
+# Small, mergeable per-partition summaries written next to each parquet artifact.
+# Merging sketches answers dataset-wide QA questions without rereading parquet.
+
+SUMMARY_FORMAT_VERSION = 1
+SUMMARY_SUFFIX = ".summary.json"
+
+DELTA_COLUMN = "LapTime_delta_s"
+
+
+@dataclass(frozen=True)
+class SummarySpec:
+    """
+    What to summarize and how to partition it.
+
+    Outliers (counted, not dropped):
+    - lap times <= min_lap_time_s or > max_lap_time_s (if set)
+    - lap times > slow_lap_ratio x the partition median (if set; the 107% rule
+      flags pit, safety-car and aborted laps)
+    - |next - current| > max_abs_delta_s
+
+    Counts are per partition, so they still merge by addition.
+    """
+    partition_cols: Sequence[str] = ("Year", "EventName", "Session", "Compound")
+    relative_accuracy: float = 0.001
+    min_lap_time_s: float = 0.0
+    max_lap_time_s: float | None = None
+    slow_lap_ratio: float | None = 1.07
+    max_abs_delta_s: float = 30.0
+
+
+@dataclass
+class QuantileSketch:
+    """
+    Log-bucketed quantile sketch (DDSketch-style).
+
+    Quantile estimates have bounded relative error and two sketches with the same
+    accuracy merge exactly by adding bucket counts.
+    """
+    relative_accuracy: float = 0.001
+    positive: dict[int, int] = field(default_factory=dict)
+    negative: dict[int, int] = field(default_factory=dict)
+    zero_count: int = 0
+
+    _MIN_ABS_VALUE = 1e-9
+
+    @property
+    def gamma(self) -> float:
+        return (1.0 + self.relative_accuracy) / (1.0 - self.relative_accuracy)
+
+    @property
+    def count(self) -> int:
+        return self.zero_count + sum(self.positive.values()) + sum(self.negative.values())
+
+    def add(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype=float)
+        values = values[np.isfinite(values)]
+        if values.size == 0:
+            return
+        small = np.abs(values) < self._MIN_ABS_VALUE
+        self.zero_count += int(small.sum())
+        log_gamma = math.log(self.gamma)
+        for store, part in ((self.positive, values[~small & (values > 0)]), (self.negative, -values[~small & (values < 0)])):
+            if part.size == 0:
+                continue
+            idx = np.ceil(np.log(part) / log_gamma).astype(np.int64)
+            keys, counts = np.unique(idx, return_counts=True)
+            for k, c in zip(keys.tolist(), counts.tolist()):
+                store[k] = store.get(k, 0) + c
+
+    def merge(self, other: QuantileSketch) -> QuantileSketch:
+        if not math.isclose(self.relative_accuracy, other.relative_accuracy):
+            raise ValueError("QuantileSketch.merge: relative_accuracy mismatch")
+        out = QuantileSketch(
+            relative_accuracy=self.relative_accuracy,
+            positive=dict(self.positive),
+            negative=dict(self.negative),
+            zero_count=self.zero_count + other.zero_count,
+        )
+        for store, src in ((out.positive, other.positive), (out.negative, other.negative)):
+            for k, c in src.items():
+                store[k] = store.get(k, 0) + c
+        return out
+
+    def quantiles(self, qs: Sequence[float]) -> list[float]:
+        n = self.count
+        if n == 0:
+            return [math.nan for _ in qs]
+
+        gamma = self.gamma
+        neg_keys = np.array(sorted(self.negative, reverse=True), dtype=np.int64)
+        pos_keys = np.array(sorted(self.positive), dtype=np.int64)
+        # Bucket representative values in ascending order: negatives, zero, positives.
+        values = np.concatenate(
+            [
+                -2.0 * np.power(gamma, neg_keys.astype(float)) / (gamma + 1.0),
+                np.zeros(1),
+                2.0 * np.power(gamma, pos_keys.astype(float)) / (gamma + 1.0),
+            ]
+        )
+        counts = np.concatenate(
+            [
+                np.array([self.negative[k] for k in neg_keys.tolist()], dtype=np.int64),
+                np.array([self.zero_count], dtype=np.int64),
+                np.array([self.positive[k] for k in pos_keys.tolist()], dtype=np.int64),
+            ]
+        )
+        cum = np.cumsum(counts)
+        ranks = np.asarray(qs, dtype=float) * (n - 1)
+        pos = np.searchsorted(cum, ranks, side="right")
+        return values[np.minimum(pos, len(values) - 1)].tolist()
+
+    def to_dict(self) -> dict:
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "positive": [sorted(self.positive), [self.positive[k] for k in sorted(self.positive)]],
+            "negative": [sorted(self.negative), [self.negative[k] for k in sorted(self.negative)]],
+            "zero_count": self.zero_count,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> QuantileSketch:
+        return cls(
+            relative_accuracy=float(data["relative_accuracy"]),
+            positive=dict(zip(*data["positive"])),
+            negative=dict(zip(*data["negative"])),
+            zero_count=int(data["zero_count"]),
+        )
+
+
+@dataclass
+class ColumnSummary:
+    """
+    Mergeable summary of one numeric column: moments, extremes, nulls, outliers, quantiles.
+    """
+    count: int = 0
+    null_count: int = 0
+    outlier_count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    min: float = math.inf
+    max: float = -math.inf
+    sketch: QuantileSketch = field(default_factory=QuantileSketch)
+
+    @classmethod
+    def from_values(
+        cls,
+        values: np.ndarray,
+        *,
+        outliers: np.ndarray | None = None,
+        relative_accuracy: float = 0.001,
+    ) -> ColumnSummary:
+        values = np.asarray(values, dtype=float)
+        finite = np.isfinite(values)
+        x = values[finite]
+        out = cls(
+            count=int(x.size),
+            null_count=int((~finite).sum()),
+            outlier_count=int(np.asarray(outliers)[finite].sum()) if outliers is not None else 0,
+            sketch=QuantileSketch(relative_accuracy=relative_accuracy),
+        )
+        if x.size:
+            out.mean = float(x.mean())
+            out.m2 = float(((x - out.mean) ** 2).sum())
+            out.min = float(x.min())
+            out.max = float(x.max())
+            out.sketch.add(x)
+        return out
+
+    @property
+    def var(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else math.nan
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.var) if self.count > 1 else math.nan
+
+    def merge(self, other: ColumnSummary) -> ColumnSummary:
+        n = self.count + other.count
+        if n == 0:
+            mean, m2 = 0.0, 0.0
+        else:
+            # Chan et al. parallel update of mean / sum of squared deviations.
+            delta = other.mean - self.mean
+            mean = self.mean + delta * other.count / n
+            m2 = self.m2 + other.m2 + delta * delta * self.count * other.count / n
+        return ColumnSummary(
+            count=n,
+            null_count=self.null_count + other.null_count,
+            outlier_count=self.outlier_count + other.outlier_count,
+            mean=mean,
+            m2=m2,
+            min=min(self.min, other.min),
+            max=max(self.max, other.max),
+            sketch=self.sketch.merge(other.sketch),
+        )
+
+    def quantiles(self, qs: Sequence[float]) -> list[float]:
+        # Clamp bucket representatives to the exact observed range.
+        return [min(max(v, self.min), self.max) if self.count else v for v in self.sketch.quantiles(qs)]
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "null_count": self.null_count,
+            "outlier_count": self.outlier_count,
+            "mean": self.mean,
+            "m2": self.m2,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "sketch": self.sketch.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> ColumnSummary:
+        return cls(
+            count=int(data["count"]),
+            null_count=int(data["null_count"]),
+            outlier_count=int(data["outlier_count"]),
+            mean=float(data["mean"]),
+            m2=float(data["m2"]),
+            min=math.inf if data["min"] is None else float(data["min"]),
+            max=-math.inf if data["max"] is None else float(data["max"]),
+            sketch=QuantileSketch.from_dict(data["sketch"]),
+        )
+
+
+@dataclass
+class PartitionSummary:
+    keys: dict[str, object]
+    columns: dict[str, ColumnSummary]
+
+    def to_dict(self) -> dict:
+        return {"keys": self.keys, "columns": {k: v.to_dict() for k, v in self.columns.items()}}
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> PartitionSummary:
+        return cls(
+            keys=dict(data["keys"]),
+            columns={k: ColumnSummary.from_dict(v) for k, v in data["columns"].items()},
+        )
+
+
+def _json_key(value: object) -> object:
+    if isinstance(value, np.generic):
+        value = value.item()
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return None
+    return value
+
+
+def _summary_columns(df: pd.DataFrame) -> dict[str, np.ndarray]:
+    cols: dict[str, np.ndarray] = {}
+    if "LapTime_s" in df.columns:
+        cols["LapTime_s"] = df["LapTime_s"].to_numpy(dtype=float, na_value=np.nan)
+    elif "LapTime" in df.columns:
+        cols["LapTime_s"] = _lap_time_to_seconds(df["LapTime"]).to_numpy(dtype=float, na_value=np.nan)
+    if "LapTime_next_s" in df.columns:
+        cols["LapTime_next_s"] = df["LapTime_next_s"].to_numpy(dtype=float, na_value=np.nan)
+        if "LapTime_s" in cols:
+            cols[DELTA_COLUMN] = cols["LapTime_next_s"] - cols["LapTime_s"]
+    return cols
+
+
+def _outlier_mask(name: str, values: np.ndarray, spec: SummarySpec) -> np.ndarray:
+    with np.errstate(invalid="ignore"):
+        if name == DELTA_COLUMN:
+            return np.abs(values) > spec.max_abs_delta_s
+        mask = values <= spec.min_lap_time_s
+        if spec.max_lap_time_s is not None:
+            mask |= values > spec.max_lap_time_s
+        if spec.slow_lap_ratio is not None and np.isfinite(values).any():
+            mask |= values > spec.slow_lap_ratio * np.nanmedian(values)
+        return mask
+
+
+def summarize_frame(df: pd.DataFrame, *, spec: SummarySpec = SummarySpec()) -> list[PartitionSummary]:
+    """
+    Compute one PartitionSummary per distinct value of spec.partition_cols.
+
+    Summarized columns: LapTime_s (derived from LapTime if needed), LapTime_next_s
+    and the next-minus-current delta, whichever are available. An empty frame has
+    no partitions.
+    """
+    if not len(df):
+        return []
+    cols = _summary_columns(df)
+    part_cols = [c for c in spec.partition_cols if c in df.columns]
+
+    if part_cols:
+        indices = df.groupby(part_cols, sort=True, dropna=False).indices
+        groups = []
+        for key, idx in indices.items():
+            key = key if isinstance(key, tuple) else (key,)
+            groups.append(({c: _json_key(v) for c, v in zip(part_cols, key)}, idx))
+    else:
+        groups = [({}, np.arange(len(df)))]
+
+    out: list[PartitionSummary] = []
+    for keys, rows in groups:
+        summaries = {
+            name: ColumnSummary.from_values(
+                values[rows],
+                outliers=_outlier_mask(name, values[rows], spec),
+                relative_accuracy=spec.relative_accuracy,
+            )
+            for name, values in cols.items()
+        }
+        out.append(PartitionSummary(keys=keys, columns=summaries))
+    return out
+
+
+def summary_sidecar_path(parquet_path: Path) -> Path:
+    return parquet_path.with_suffix(SUMMARY_SUFFIX)
+
+
+def write_summary_sidecar(
+    df: pd.DataFrame | pa.Table,
+    parquet_path: Path,
+    *,
+    spec: SummarySpec = SummarySpec(),
+) -> Path:
+    """
+    Summarize df and write the sketches next to parquet_path.
+
+    Arrow tables are supported; only the columns the summary needs are converted.
+    """
+    if isinstance(df, pa.Table):
+        needed = [*spec.partition_cols, "LapTime", "LapTime_s", "LapTime_next_s"]
+        df = df.select([c for c in needed if c in df.column_names]).to_pandas()
+    return write_summary_partitions(summarize_frame(df, spec=spec), parquet_path)
+
+
+def write_summary_partitions(partitions: Sequence[PartitionSummary], parquet_path: Path) -> Path:
+    """
+    Write already computed partition summaries next to parquet_path.
+    """
+    path = summary_sidecar_path(parquet_path)
+    payload = {
+        "version": SUMMARY_FORMAT_VERSION,
+        "artifact": parquet_path.name,
+        "partitions": [p.to_dict() for p in partitions],
+    }
+    path.write_text(json.dumps(payload))
+    return path
+
+
+def read_summary_sidecar(path: Path) -> list[PartitionSummary]:
+    payload = json.loads(Path(path).read_text())
+    if payload.get("version") != SUMMARY_FORMAT_VERSION:
+        raise ValueError(f"{path}: unsupported summary version: {payload.get('version')}")
+    return [PartitionSummary.from_dict(p) for p in payload["partitions"]]
+
+
+def read_summaries(paths: Iterable[Path]) -> list[PartitionSummary]:
+    out: list[PartitionSummary] = []
+    for path in paths:
+        out.extend(read_summary_sidecar(path))
+    return out
+
+
+def merge_summaries(
+    partitions: Iterable[PartitionSummary],
+    *,
+    by: Sequence[str] = (),
+) -> dict[tuple, dict[str, ColumnSummary]]:
+    """
+    Merge partition summaries, grouped by a subset of their keys (empty = dataset-wide).
+    """
+    merged: dict[tuple, dict[str, ColumnSummary]] = {}
+    for part in partitions:
+        missing = [k for k in by if k not in part.keys]
+        if missing:
+            raise ValueError(f"merge_summaries: partition has no keys {missing}")
+        group = tuple(part.keys[k] for k in by)
+        acc = merged.setdefault(group, {})
+        for name, summary in part.columns.items():
+            acc[name] = acc[name].merge(summary) if name in acc else summary
+    return merged
+
+
+def summaries_to_frame(
+    merged: Mapping[tuple, Mapping[str, ColumnSummary]],
+    *,
+    by: Sequence[str] = (),
+    quantiles: Sequence[float] = (0.05, 0.25, 0.5, 0.75, 0.95),
+) -> pd.DataFrame:
+    """
+    Flatten merged summaries into a display table (one row per group and column).
+    """
+    rows = []
+    for group, columns in merged.items():
+        for name, s in columns.items():
+            row: dict[str, object] = dict(zip(by, group))
+            row.update(
+                column=name,
+                count=s.count,
+                nulls=s.null_count,
+                outliers=s.outlier_count,
+                mean=s.mean if s.count else math.nan,
+                std=s.std,
+                min=s.min if s.count else math.nan,
+                max=s.max if s.count else math.nan,
+            )
+            for q, v in zip(quantiles, s.quantiles(quantiles)):
+                row[f"q{round(q * 100):02d}"] = v
+            rows.append(row)
+    return pd.DataFrame(rows)
@@ -0,0 +1,373 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from f1laptime.data.contracts import DRIVER_KEY_COLS, SESSION_KEY_COLS, STINT_KEY_COLS
+from f1laptime.data.parquet_io import file_fingerprint
+
+
+# ---- Group index (v1) ----
+# Sorted permutation + CSR-style offsets for the session / driver / stint levels.
+# Built once per table, persisted next to its parquet, and reused by every
+# grouped transform so they run on contiguous slices instead of regrouping.
+
+GROUP_INDEX_SUFFIX = ".groups.npz"
+GROUP_INDEX_FORMAT_VERSION = 2
+
+Level = Literal["session", "driver", "stint"]
+
+
+def segment_cumsum(values: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """
+    Running sum that restarts at every segment start (values in segment order).
+
+    Each segment is summed on its own, so results are bit-identical to a cumsum
+    of that segment alone and do not depend on the other rows.
+    """
+    values = np.asarray(values, dtype=float)
+    n = values.size
+    if n == 0:
+        return values.copy()
+    starts = np.asarray(starts, dtype=np.int64)
+    lengths = np.diff(np.append(starts, n))
+    width = int(lengths.max())
+    if len(starts) * width > 4 * n + 1024:
+        # Very uneven segments: padding would be large, sum them one by one
+        return np.concatenate([np.cumsum(values[a : a + m]) for a, m in zip(starts, lengths)])
+    # One row per segment, zero padded at the end; row-wise cumsum never mixes rows
+    col = np.arange(n) - np.repeat(starts, lengths)
+    row = np.repeat(np.arange(len(starts)), lengths)
+    padded = np.zeros((len(starts), width))
+    padded[row, col] = values
+    return np.cumsum(padded, axis=1)[row, col]
+
+
+def _sort_codes(values: pd.Series) -> np.ndarray:
+    # Codes in sorted value order with missing values last, like sort_values
+    codes, uniques = pd.factorize(values, sort=True, use_na_sentinel=True)
+    codes = codes.astype(np.int64)
+    codes[codes < 0] = len(uniques)
+    return codes
+
+
+def _change_starts(codes: list[np.ndarray], n: int) -> np.ndarray:
+    change = np.zeros(n, dtype=bool)
+    if n:
+        change[0] = True
+    for c in codes:
+        change[1:] |= c[1:] != c[:-1]
+    return np.flatnonzero(change)
+
+
+def _is_identity(order: np.ndarray) -> bool:
+    return bool(np.array_equal(order, np.arange(order.size)))
+
+
+def _offsets(starts: np.ndarray, n: int) -> np.ndarray:
+    return np.append(starts, n).astype(np.int64)
+
+
+@dataclass(frozen=True)
+class GroupIndex:
+    """
+    Row order and group boundaries of a laps-like table.
+
+    order[i] is the position (in the indexed table) of the i-th row in
+    (Year, EventName, Session, Driver, LapNumber) order. *_offsets are CSR offsets
+    into that sorted order: group g spans [offsets[g], offsets[g + 1]).
+    Stints are contiguous runs of equal Stint within a driver.
+    is_sorted says order is the identity (the table is already in sorted order);
+    it is set where the index is made, never recomputed per call.
+    """
+    order: np.ndarray
+    session_offsets: np.ndarray
+    driver_offsets: np.ndarray
+    stint_offsets: np.ndarray
+    is_sorted: bool = False
+
+    @property
+    def n_rows(self) -> int:
+        return int(self.order.size)
+
+    def offsets(self, level: Level) -> np.ndarray:
+        if level == "session":
+            return self.session_offsets
+        if level == "driver":
+            return self.driver_offsets
+        if level == "stint":
+            return self.stint_offsets
+        raise ValueError(f"Unknown group level: {level}")
+
+    def starts(self, level: Level) -> np.ndarray:
+        return self.offsets(level)[:-1]
+
+    def lengths(self, level: Level) -> np.ndarray:
+        return np.diff(self.offsets(level))
+
+    def group_ids(self, level: Level) -> np.ndarray:
+        """
+        Group number of every row in sorted order.
+        """
+        return np.repeat(np.arange(len(self.offsets(level)) - 1), self.lengths(level))
+
+    # ---- table <-> sorted order ----
+
+    def take(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Rows of the indexed table in sorted order (labels preserved).
+        """
+        if len(df) != self.n_rows:
+            raise ValueError(f"GroupIndex has {self.n_rows} rows, table has {len(df)}")
+        return df if self.is_sorted else df.iloc[self.order]
+
+    def sorted(self) -> GroupIndex:
+        """
+        The same groups, describing the table after take().
+        """
+        return GroupIndex(
+            order=np.arange(self.n_rows, dtype=np.int64),
+            session_offsets=self.session_offsets,
+            driver_offsets=self.driver_offsets,
+            stint_offsets=self.stint_offsets,
+            is_sorted=True,
+        )
+
+    def to_sorted(self, values: np.ndarray) -> np.ndarray:
+        """
+        Table-order values -> sorted order.
+        """
+        values = np.asarray(values)
+        return values if self.is_sorted else values[self.order]
+
+    def from_sorted(self, values: np.ndarray) -> np.ndarray:
+        """
+        Sorted-order values -> table order.
+        """
+        values = np.asarray(values)
+        if self.is_sorted:
+            return values
+        out = np.empty_like(values)
+        out[self.order] = values
+        return out
+
+    def subset(self, keep: np.ndarray) -> GroupIndex:
+        """
+        Index of table[keep] (keep is a boolean mask in table order), without regrouping.
+        """
+        keep = np.asarray(keep, dtype=bool)
+        if keep.size != self.n_rows:
+            raise ValueError(f"GroupIndex.subset: mask has {keep.size} rows, expected {self.n_rows}")
+        new_pos = np.cumsum(keep) - 1
+        kept_sorted = keep[self.order]
+        order = new_pos[self.order[kept_sorted]]
+
+        # Kept rows per group, then drop groups that became empty
+        cum = np.concatenate([[0], np.cumsum(kept_sorted)])
+
+        def remap(offsets: np.ndarray) -> np.ndarray:
+            return np.unique(cum[offsets])
+
+        return GroupIndex(
+            order=order.astype(np.int64),
+            session_offsets=remap(self.session_offsets),
+            driver_offsets=remap(self.driver_offsets),
+            stint_offsets=remap(self.stint_offsets),
+            # Dropping rows keeps the relative order, so a sorted table stays sorted
+            is_sorted=self.is_sorted,
+        )
+
+    # ---- grouped kernels on values in sorted order ----
+
+    def shift(self, values: np.ndarray, k: int, *, level: Level = "driver") -> np.ndarray:
+        """
+        Grouped shift by k rows (k < 0 looks ahead); NaN where it would cross a group.
+        """
+        values = np.asarray(values, dtype=float)
+        out = np.full(values.shape, np.nan)
+        n = values.size
+        if k == 0:
+            return values.copy()
+        if abs(k) >= n:
+            return out
+        gid = self.group_ids(level)
+        if k > 0:
+            out[k:] = np.where(gid[k:] == gid[:-k], values[:-k], np.nan)
+        else:
+            k = -k
+            out[:-k] = np.where(gid[:-k] == gid[k:], values[k:], np.nan)
+        return out
+
+    def cumsum(self, values: np.ndarray, *, level: Level = "driver") -> np.ndarray:
+        return segment_cumsum(values, self.starts(level))
+
+    def reduce(self, values: np.ndarray, *, level: Level = "driver", how: str = "sum") -> np.ndarray:
+        """
+        One value per group: sum / mean / count of finite values, or min / max.
+        """
+        values = np.asarray(values, dtype=float)
+        starts = self.starts(level)
+        if values.size == 0:
+            return np.zeros(0)
+        finite = np.isfinite(values)
+        if how in ("sum", "mean", "count"):
+            total = np.add.reduceat(np.where(finite, values, 0.0), starts)
+            count = np.add.reduceat(finite.astype(float), starts)
+            if how == "sum":
+                return total
+            if how == "count":
+                return count
+            with np.errstate(invalid="ignore", divide="ignore"):
+                return total / count
+        if how == "min":
+            return np.minimum.reduceat(np.where(finite, values, np.inf), starts)
+        if how == "max":
+            return np.maximum.reduceat(np.where(finite, values, -np.inf), starts)
+        raise ValueError(f"Unknown reduction: {how}")
+
+    def rolling_mean(
+        self,
+        values: np.ndarray,
+        window: int,
+        *,
+        level: Level = "driver",
+        min_periods: int = 1,
+    ) -> np.ndarray:
+        """
+        Trailing window mean (current row included) within groups, NaN-skipping.
+        """
+        s1, _, count, center = self._rolling_sums(values, window, level)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(count >= min_periods, center + s1 / count, np.nan)
+
+    def rolling_std(
+        self,
+        values: np.ndarray,
+        window: int,
+        *,
+        level: Level = "driver",
+        min_periods: int = 2,
+    ) -> np.ndarray:
+        """
+        Trailing window sample std (ddof=1) within groups, NaN-skipping.
+        """
+        s1, s2, count, _ = self._rolling_sums(values, window, level)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            var = (s2 - s1 * s1 / count) / (count - 1)
+            return np.where(count >= max(min_periods, 2), np.sqrt(np.maximum(var, 0.0)), np.nan)
+
+    def _rolling_sums(
+        self,
+        values: np.ndarray,
+        window: int,
+        level: Level,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+        """
+        Windowed sums of centered values, their squares and the finite count.
+        """
+        if window < 1:
+            raise ValueError("window must be >= 1")
+        values = np.asarray(values, dtype=float)
+        finite = np.isfinite(values)
+        center = float(values[finite].mean()) if finite.any() else 0.0
+        xc = np.where(finite, values - center, 0.0)
+
+        starts = self.starts(level)
+        lag = np.arange(values.size) - window
+        inside = lag >= np.repeat(starts, self.lengths(level))
+
+        def windowed(v: np.ndarray) -> np.ndarray:
+            cs = segment_cumsum(v, starts)
+            return cs - np.where(inside, cs[np.maximum(lag, 0)], 0.0)
+
+        return windowed(xc), windowed(xc * xc), windowed(finite.astype(float)), center
+
+    # ---- persistence ----
+
+    def save(self, path: Path, *, source: str = "") -> Path:
+        """
+        source identifies the table the index describes (see save_group_index).
+        """
+        np.savez(
+            path,
+            version=np.array(GROUP_INDEX_FORMAT_VERSION),
+            source=np.array(source),
+            order=self.order,
+            session_offsets=self.session_offsets,
+            driver_offsets=self.driver_offsets,
+            stint_offsets=self.stint_offsets,
+        )
+        return Path(path)
+
+    @classmethod
+    def load(cls, path: Path) -> GroupIndex:
+        with np.load(path) as data:
+            if int(data["version"]) != GROUP_INDEX_FORMAT_VERSION:
+                raise ValueError(f"{path}: unsupported group index version: {int(data['version'])}")
+            return cls(
+                order=data["order"],
+                session_offsets=data["session_offsets"],
+                driver_offsets=data["driver_offsets"],
+                stint_offsets=data["stint_offsets"],
+                is_sorted=_is_identity(data["order"]),
+            )
+
+
+def build_group_index(df: pd.DataFrame) -> GroupIndex:
+    """
+    Sort once and record session / driver / stint boundaries.
+
+    The order matches df.sort_values([Year, EventName, Session, Driver, LapNumber]).
+    """
+    n = len(df)
+    level_codes = {c: _sort_codes(df[c]) for c in DRIVER_KEY_COLS}
+    lap = df["LapNumber"].to_numpy(dtype=float, na_value=np.nan)
+    # np.lexsort: last key is primary; stable, NaN laps last
+    order = np.lexsort((lap, *(level_codes[c] for c in reversed(DRIVER_KEY_COLS)))).astype(np.int64)
+
+    sorted_codes = {c: codes[order] for c, codes in level_codes.items()}
+    stint_codes, _ = pd.factorize(df["Stint"], use_na_sentinel=True) if "Stint" in df.columns else (np.zeros(n), None)
+    sorted_codes["Stint"] = np.asarray(stint_codes)[order]
+
+    return GroupIndex(
+        order=order,
+        session_offsets=_offsets(_change_starts([sorted_codes[c] for c in SESSION_KEY_COLS], n), n),
+        driver_offsets=_offsets(_change_starts([sorted_codes[c] for c in DRIVER_KEY_COLS], n), n),
+        stint_offsets=_offsets(_change_starts([sorted_codes[c] for c in STINT_KEY_COLS], n), n),
+        is_sorted=_is_identity(order),
+    )
+
+
+def group_index_path(parquet_path: Path) -> Path:
+    return parquet_path.with_suffix(GROUP_INDEX_SUFFIX)
+
+
+def save_group_index(index: GroupIndex, parquet_path: Path) -> Path:
+    """
+    Persist index next to parquet_path, which must already hold the indexed table.
+    """
+    return index.save(group_index_path(parquet_path), source=file_fingerprint(parquet_path))
+
+
+def load_group_index(parquet_path: Path) -> GroupIndex | None:
+    """
+    The persisted index for parquet_path, or None if absent or out of date
+    (parquet rewritten since the index was saved, or an older index format).
+    """
+    path = group_index_path(parquet_path)
+    if not path.exists():
+        return None
+    with np.load(path) as data:
+        if int(data["version"]) != GROUP_INDEX_FORMAT_VERSION:
+            return None
+        if str(data["source"]) != file_fingerprint(parquet_path):
+            return None
+    index = GroupIndex.load(path)
+    if index.n_rows != pq.ParquetFile(parquet_path).metadata.num_rows:
+        return None
+    return index
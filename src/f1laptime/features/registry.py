@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Iterable, Sequence
+
+import numpy as np
+import pandas as pd
+
+from f1laptime.features.group_index import GroupIndex
+from f1laptime.features.transforms_stint import StintFeatureSpec, compute_stint_features
+
+
+FeatureFn = Callable[[pd.DataFrame, GroupIndex], "pd.Series | np.ndarray"]
+
+
+@dataclass(frozen=True)
+class FeatureDef:
+    """
+    A derived column: how to compute it, what it reads and its definition version.
+
+    compute(df, index) gets the partition's columns and its GroupIndex (rows in
+    df's order). deps name base columns or other registered features. Bump version
+    whenever the definition changes so cached values are recomputed.
+    """
+    name: str
+    version: int
+    deps: tuple[str, ...]
+    compute: FeatureFn
+    description: str = ""
+
+
+class FeatureRegistry:
+    """
+    Name -> FeatureDef mapping with dependency resolution.
+    """
+
+    def __init__(self) -> None:
+        self._features: dict[str, FeatureDef] = {}
+
+    def register(self, feature: FeatureDef) -> FeatureDef:
+        if feature.name in self._features:
+            raise ValueError(f"Feature already registered: {feature.name}")
+        self._features[feature.name] = feature
+        return feature
+
+    def feature(
+        self,
+        name: str,
+        *,
+        version: int,
+        deps: Sequence[str],
+        description: str = "",
+    ) -> Callable[[FeatureFn], FeatureFn]:
+        """
+        Decorator form of register().
+        """
+
+        def decorator(fn: FeatureFn) -> FeatureFn:
+            self.register(FeatureDef(name=name, version=version, deps=tuple(deps), compute=fn, description=description))
+            return fn
+
+        return decorator
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._features
+
+    def __getitem__(self, name: str) -> FeatureDef:
+        try:
+            return self._features[name]
+        except KeyError:
+            raise KeyError(f"Unknown feature: {name}") from None
+
+    def names(self) -> list[str]:
+        return sorted(self._features)
+
+    def resolve(self, names: Iterable[str]) -> list[FeatureDef]:
+        """
+        Features needed to compute names, dependencies first. Names that are not
+        registered are treated as base columns.
+        """
+        order: list[FeatureDef] = []
+        state: dict[str, str] = {}
+
+        def visit(name: str, path: tuple[str, ...]) -> None:
+            if name not in self._features or state.get(name) == "done":
+                return
+            if state.get(name) == "visiting":
+                raise ValueError(f"Feature dependency cycle: {' -> '.join((*path, name))}")
+            state[name] = "visiting"
+            for dep in self._features[name].deps:
+                visit(dep, (*path, name))
+            state[name] = "done"
+            order.append(self._features[name])
+
+        for name in names:
+            visit(name, ())
+        return order
+
+
+def _lag(k: int) -> FeatureFn:
+    def compute(df: pd.DataFrame, index: GroupIndex) -> np.ndarray:
+        y = index.to_sorted(df["LapTime_s"].to_numpy(dtype=float, na_value=np.nan))
+        return index.from_sorted(index.shift(y, k))
+
+    return compute
+
+
+def _rolling(window: int, how: str) -> FeatureFn:
+    def compute(df: pd.DataFrame, index: GroupIndex) -> np.ndarray:
+        y = index.to_sorted(df["LapTime_s"].to_numpy(dtype=float, na_value=np.nan))
+        if how == "mean":
+            return index.from_sorted(index.rolling_mean(y, window, min_periods=1))
+        return index.from_sorted(index.rolling_std(y, window, min_periods=2))
+
+    return compute
+
+
+def _stint_column(name: str, spec: StintFeatureSpec = StintFeatureSpec()) -> FeatureFn:
+    def compute(df: pd.DataFrame, index: GroupIndex) -> np.ndarray:
+        feats = compute_stint_features(
+            index.starts("stint"),
+            index.to_sorted(df["LapNumber"].to_numpy(dtype=float, na_value=np.nan)),
+            index.to_sorted(df["LapTime_s"].to_numpy(dtype=float, na_value=np.nan)),
+            spec=spec,
+        )
+        return index.from_sorted(feats[name])
+
+    return compute
+
+
+def default_registry() -> FeatureRegistry:
+    """
+    Built-in features. Grouped ones run on the GroupIndex they are given
+    (see f1laptime.features.group_index), so partitions need not be pre-sorted.
+    """
+    reg = FeatureRegistry()
+
+    for k in (1, 2, 3, 4, 5):
+        reg.register(
+            FeatureDef(
+                name=f"LapTime_lag_{k}_s",
+                version=1,
+                deps=("LapTime_s",),
+                compute=_lag(k),
+                description=f"LapTime_s {k} laps earlier (same driver/session)",
+            )
+        )
+
+    for w in (3, 5):
+        reg.register(
+            FeatureDef(
+                name=f"LapTime_roll_{w}_mean_s",
+                version=1,
+                deps=("LapTime_s",),
+                compute=_rolling(w, "mean"),
+                description=f"Mean of the last {w} laps including the current one",
+            )
+        )
+        reg.register(
+            FeatureDef(
+                name=f"LapTime_roll_{w}_std_s",
+                version=1,
+                deps=("LapTime_s",),
+                compute=_rolling(w, "std"),
+                description=f"Std of the last {w} laps including the current one",
+            )
+        )
+
+    reg.register(
+        FeatureDef(
+            name="LapTime_diff_1_s",
+            version=1,
+            deps=("LapTime_s", "LapTime_lag_1_s"),
+            compute=lambda df, index: df["LapTime_s"] - df["LapTime_lag_1_s"],
+            description="Change versus the previous lap",
+        )
+    )
+
+    for name in ("StintLap", "LapTime_fuelcorr_s", "StintDeg_lin_slope_exp_s", "StintDeg_quad_curv_exp_s"):
+        reg.register(
+            FeatureDef(
+                name=name,
+                version=1,
+                deps=("LapTime_s",),
+                compute=_stint_column(name),
+                description="See f1laptime.features.transforms_stint (default StintFeatureSpec)",
+            )
+        )
+
+    return reg
+
+
+DEFAULT_REGISTRY: FeatureRegistry = default_registry()
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Sequence
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from f1laptime.data.contracts import FEATURE_KEY_COLS
+from f1laptime.data.parquet_io import DEFAULT_WRITE_PROFILE, WriteProfile, file_fingerprint, write_parquet
+from f1laptime.features.group_index import build_group_index, load_group_index
+from f1laptime.features.registry import DEFAULT_REGISTRY, FeatureDef, FeatureRegistry
+
+
+# ---- Feature store (v1) ----
+# Features are materialized lazily, one column file per (partition, feature):
+#   <root>/<partition stem>/<feature>.parquet + manifest.json
+# A cached column is reused while its fingerprint (definition version + input
+# fingerprints, down to the base parquet file) is unchanged.
+
+MANIFEST_NAME = "manifest.json"
+STORE_FORMAT_VERSION = 1
+
+
+@dataclass
+class MaterializeStats:
+    computed: dict[str, int] = field(default_factory=dict)
+    cached: dict[str, int] = field(default_factory=dict)
+
+
+def _hash(payload: object) -> str:
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()[:16]
+
+
+class FeatureStore:
+    """
+    Lazily computed, per-partition memoized feature columns over base parquet files.
+
+    A partition is one base parquet file (typically one session's examples table).
+    Feature rows are aligned with the base file's rows.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        registry: FeatureRegistry = DEFAULT_REGISTRY,
+        write_profile: str | WriteProfile = DEFAULT_WRITE_PROFILE,
+    ) -> None:
+        self.root = Path(root)
+        self.registry = registry
+        self.write_profile = write_profile
+
+    def partition_dir(self, base_path: Path) -> Path:
+        return self.root / Path(base_path).stem
+
+    def _read_manifest(self, base_path: Path) -> dict:
+        path = self.partition_dir(base_path) / MANIFEST_NAME
+        if not path.exists():
+            return {"version": STORE_FORMAT_VERSION, "features": {}}
+        manifest = json.loads(path.read_text())
+        if manifest.get("version") != STORE_FORMAT_VERSION:
+            return {"version": STORE_FORMAT_VERSION, "features": {}}
+        return manifest
+
+    def _write_manifest(self, base_path: Path, manifest: dict) -> None:
+        path = self.partition_dir(base_path) / MANIFEST_NAME
+        tmp = path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+        tmp.replace(path)
+
+    def fingerprints(self, base_path: Path, features: Sequence[FeatureDef]) -> dict[str, str]:
+        """
+        Fingerprint per feature; features must be in dependency order (see resolve()).
+        """
+        base_fp = file_fingerprint(Path(base_path))
+        out: dict[str, str] = {}
+        for f in features:
+            deps = {d: out.get(d, base_fp) for d in f.deps}
+            out[f.name] = _hash({"name": f.name, "version": f.version, "deps": deps})
+        return out
+
+    def _feature_path(self, base_path: Path, name: str) -> Path:
+        return self.partition_dir(base_path) / f"{name}.parquet"
+
+    def _ensure(
+        self,
+        base_path: Path,
+        names: Sequence[str],
+        stats: MaterializeStats | None = None,
+    ) -> dict[str, np.ndarray]:
+        """
+        Make sure names are materialized for one partition; returns the columns
+        computed by this call (so callers need not read them back).
+        """
+        base_path = Path(base_path)
+        base_cols = set(pq.read_schema(base_path).names)
+        # Base columns win over registered features with the same name
+        plan = [f for f in self.registry.resolve(n for n in names if n not in base_cols) if f.name not in base_cols]
+        if not plan:
+            return {}
+
+        fps = self.fingerprints(base_path, plan)
+        manifest = self._read_manifest(base_path)
+        entries = manifest["features"]
+        stale = [f for f in plan if entries.get(f.name, {}).get("fingerprint") != fps[f.name]]
+        if not stale:
+            if stats is not None:
+                for f in plan:
+                    stats.cached[f.name] = stats.cached.get(f.name, 0) + 1
+            return {}
+
+        # Only read what the stale features need
+        need_base = set(FEATURE_KEY_COLS) & base_cols
+        need_cached: set[str] = set()
+        stale_names = {f.name for f in stale}
+        for f in stale:
+            for dep in f.deps:
+                if dep in base_cols:
+                    need_base.add(dep)
+                elif dep not in stale_names:
+                    need_cached.add(dep)
+        missing = [d for f in stale for d in f.deps if d not in base_cols and d not in self.registry]
+        if missing:
+            raise ValueError(f"{base_path.name}: unknown feature inputs: {sorted(set(missing))}")
+
+        df = pd.read_parquet(base_path, columns=sorted(need_base))
+        # Reuse the index persisted with the base table instead of regrouping
+        index = load_group_index(base_path)
+        if index is None:
+            index = build_group_index(df)
+        for name in sorted(need_cached):
+            df[name] = pd.read_parquet(self._feature_path(base_path, name))[name].to_numpy()
+
+        self.partition_dir(base_path).mkdir(parents=True, exist_ok=True)
+        computed: dict[str, np.ndarray] = {}
+        for f in plan:
+            if f.name not in stale_names:
+                if stats is not None:
+                    stats.cached[f.name] = stats.cached.get(f.name, 0) + 1
+                continue
+            values = f.compute(df, index)
+            if isinstance(values, pd.Series):
+                values = values.reindex(df.index)
+            values = np.asarray(values, dtype=float)
+            if len(values) != len(df):
+                raise ValueError(f"Feature {f.name} returned {len(values)} rows, expected {len(df)}")
+            df[f.name] = values
+            computed[f.name] = values
+            # Column files carry no keys, so write_parquet keeps base row order
+            write_parquet(
+                pd.DataFrame({f.name: values}), self._feature_path(base_path, f.name), profile=self.write_profile
+            )
+            entries[f.name] = {"fingerprint": fps[f.name], "version": f.version}
+            if stats is not None:
+                stats.computed[f.name] = stats.computed.get(f.name, 0) + 1
+
+        self._write_manifest(base_path, manifest)
+        return computed
+
+    def materialize(self, base_paths: Iterable[Path], features: Sequence[str]) -> MaterializeStats:
+        """
+        Bring features (and their dependencies) up to date for every partition.
+        """
+        stats = MaterializeStats()
+        for base_path in base_paths:
+            self._ensure(Path(base_path), features, stats)
+        return stats
+
+    def load(
+        self,
+        base_path: Path,
+        features: Sequence[str],
+        *,
+        columns: Sequence[str] | None = None,
+    ) -> pd.DataFrame:
+        """
+        Base columns (all, or `columns`) plus the requested features for one partition,
+        computing only what is missing or stale.
+        """
+        base_path = Path(base_path)
+        fresh = self._ensure(base_path, features)
+        df = pd.read_parquet(base_path, columns=list(columns) if columns is not None else None)
+        base_cols = set(pq.read_schema(base_path).names)
+        for name in features:
+            if name in base_cols:
+                if name not in df.columns:
+                    df[name] = pd.read_parquet(base_path, columns=[name])[name].to_numpy()
+                continue
+            if name in fresh:
+                df[name] = fresh[name]
+            else:
+                df[name] = pd.read_parquet(self._feature_path(base_path, name))[name].to_numpy()
+        return df
+
+    def load_many(
+        self,
+        base_paths: Iterable[Path],
+        features: Sequence[str],
+        *,
+        columns: Sequence[str] | None = None,
+    ) -> pd.DataFrame:
+        frames = [self.load(p, features, columns=columns) for p in base_paths]
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from f1laptime.data.contracts import DRIVER_KEY_COLS, LAP_SORT_COLS, STINT_KEY_COLS
+from f1laptime.features.group_index import GroupIndex
+from f1laptime.features.transforms_basic import BasicExampleSpec, LapCleanSpec, _check_example_spec
+from f1laptime.features.transforms_stint import compute_stint_features
+
+
+# Arrow-native backend for the transforms in transforms_basic.
+# Same specs, same output as the pandas path, but tables stay in Arrow end to end.
+
+
+_UNITS_PER_SECOND = {"s": 1.0, "ms": 1e3, "us": 1e6, "ns": 1e9}
+
+
+def lap_time_to_seconds_arrow(values: pa.Array | pa.ChunkedArray) -> pa.ChunkedArray:
+    """
+    Arrow counterpart of _lap_time_to_seconds: float seconds, null where unknown.
+    """
+    if isinstance(values, pa.Array):
+        values = pa.chunked_array([values])
+    t = values.type
+    if pa.types.is_duration(t):
+        ticks = pc.cast(pc.cast(values, pa.int64()), pa.float64())
+        return pc.divide(ticks, _UNITS_PER_SECOND[t.unit])
+    if pa.types.is_integer(t) or pa.types.is_floating(t):
+        # Same as pd.to_timedelta on numbers: values are nanoseconds
+        return pc.divide(pc.cast(values, pa.float64()), _UNITS_PER_SECOND["ns"])
+    # Strings and anything else: parse this one column like the pandas path does
+    seconds = pd.to_timedelta(values.to_pandas(), errors="coerce").dt.total_seconds()
+    return pa.chunked_array([pa.array(seconds.to_numpy(), from_pandas=True)])
+
+
+def _not_missing(values: pa.ChunkedArray) -> pa.ChunkedArray:
+    # pandas isna semantics: null or NaN
+    return pc.invert(pc.is_null(values, nan_is_null=True))
+
+
+def _clean_mask(table: pa.Table, spec: LapCleanSpec) -> pa.ChunkedArray:
+    mask = pa.chunked_array([pa.array(np.ones(table.num_rows, dtype=bool))])
+
+    if spec.drop_pit_laps:
+        for col in ["PitInTime", "PitOutTime"]:
+            if col in table.column_names:
+                mask = pc.and_(mask, pc.is_null(table[col], nan_is_null=True))
+
+    for flag, col in [
+        (spec.drop_missing_driver, "Driver"),
+        (spec.drop_missing_lap_number, "LapNumber"),
+        (spec.drop_missing_lap_time, "LapTime"),
+    ]:
+        if flag and col in table.column_names:
+            mask = pc.and_(mask, _not_missing(table[col]))
+
+    if spec.min_lap_time_s is not None or spec.max_lap_time_s is not None:
+        lap_time_s = lap_time_to_seconds_arrow(table["LapTime"])
+        mask = pc.and_(mask, _not_missing(lap_time_s))
+        if spec.min_lap_time_s is not None:
+            mask = pc.and_(mask, pc.greater_equal(lap_time_s, spec.min_lap_time_s))
+        if spec.max_lap_time_s is not None:
+            mask = pc.and_(mask, pc.less_equal(lap_time_s, spec.max_lap_time_s))
+
+    return pc.fill_null(mask, False)
+
+
+def clean_laps_mask_arrow(
+    laps: pa.Table,
+    *,
+    spec: LapCleanSpec = LapCleanSpec(),
+) -> np.ndarray:
+    """
+    Arrow counterpart of clean_laps_mask.
+    """
+    return _clean_mask(laps, spec).to_numpy(zero_copy_only=False).astype(bool)
+
+
+def clean_laps_arrow(
+    laps: pa.Table,
+    *,
+    spec: LapCleanSpec = LapCleanSpec(),
+) -> pa.Table:
+    """
+    Arrow counterpart of clean_laps.
+    """
+    return laps.filter(_clean_mask(laps, spec))
+
+
+def _run_starts(table: pa.Table, cols: tuple[str, ...]) -> np.ndarray:
+    """
+    Row positions where any of cols changes value (table must be sorted by them).
+
+    Columns are compared through their dictionary-encoded indices, so strings are
+    hashed once instead of compared row by row.
+    """
+    n = table.num_rows
+    change = np.zeros(n, dtype=bool)
+    if n == 0:
+        return np.flatnonzero(change)
+    change[0] = True
+    for col in cols:
+        codes = pc.dictionary_encode(table[col], null_encoding="encode").combine_chunks().indices
+        codes = codes.to_numpy(zero_copy_only=False)
+        change[1:] |= codes[1:] != codes[:-1]
+    return np.flatnonzero(change)
+
+
+def _grouped_shift(values: np.ndarray, group_id: np.ndarray, k: int) -> np.ndarray:
+    """
+    values shifted by k rows within contiguous groups (k < 0 looks ahead); NaN at edges.
+    """
+    out = np.full(values.shape, np.nan)
+    n = len(values)
+    if abs(k) >= n:
+        return out
+    if k > 0:
+        same = group_id[k:] == group_id[:-k]
+        out[k:] = np.where(same, values[:-k], np.nan)
+    else:
+        k = -k
+        same = group_id[:-k] == group_id[k:]
+        out[:-k] = np.where(same, values[k:], np.nan)
+    return out
+
+
+def _float_column(values: np.ndarray) -> pa.Array:
+    # NaN -> null, matching how the pandas path writes missing floats to parquet
+    return pa.array(values, type=pa.float64(), from_pandas=True)
+
+
+def build_next_lap_examples_arrow(
+    laps: pa.Table,
+    *,
+    spec: BasicExampleSpec = BasicExampleSpec(),
+    clean_spec: LapCleanSpec | None = LapCleanSpec(),
+    index: GroupIndex | None = None,
+) -> pa.Table:
+    """
+    Arrow counterpart of build_next_lap_examples (same columns, rows and order).
+    """
+    if index is not None:
+        return build_next_lap_examples_arrow_indexed(laps, index, spec=spec, clean_spec=clean_spec)[0]
+
+    _check_example_spec(spec)
+
+    table = laps if clean_spec is None else clean_laps_arrow(laps, spec=clean_spec)
+
+    # Stable multi-key sort with nulls last, like DataFrame.sort_values
+    table = table.sort_by([(c, "ascending") for c in LAP_SORT_COLS])
+
+    lap_time_s = lap_time_to_seconds_arrow(table["LapTime"])
+    table = table.append_column("LapTime_s", lap_time_s)
+    table = table.filter(_not_missing(lap_time_s))
+
+    y = table["LapTime_s"].to_numpy()
+
+    if spec.stint is not None:
+        feats = compute_stint_features(
+            _run_starts(table, STINT_KEY_COLS),
+            pc.cast(table["LapNumber"], pa.float64()).to_numpy(),
+            y,
+            spec=spec.stint,
+        )
+        for name, values in feats.items():
+            table = table.append_column(name, _float_column(values))
+
+    starts = _run_starts(table, DRIVER_KEY_COLS)
+    group_id = np.zeros(table.num_rows, dtype=np.int64)
+    group_id[starts[1:]] = 1
+    group_id = np.cumsum(group_id)
+
+    for k in spec.lags:
+        table = table.append_column(f"LapTime_lag_{k}_s", _float_column(_grouped_shift(y, group_id, k)))
+
+    target = _grouped_shift(y, group_id, -1)
+    table = table.append_column("LapTime_next_s", _float_column(target))
+
+    return table.filter(pa.array(~np.isnan(target)))
+
+
+def build_next_lap_examples_arrow_indexed(
+    laps: pa.Table,
+    index: GroupIndex,
+    *,
+    spec: BasicExampleSpec = BasicExampleSpec(),
+    clean_spec: LapCleanSpec | None = LapCleanSpec(),
+) -> tuple[pa.Table, GroupIndex]:
+    """
+    Arrow counterpart of build_next_lap_examples_indexed.
+    """
+    _check_example_spec(spec)
+
+    table = laps
+    if clean_spec is not None:
+        keep = clean_laps_mask_arrow(laps, spec=clean_spec)
+        table = table.filter(pa.array(keep))
+        index = index.subset(keep)
+
+    if not index.is_sorted:
+        table = table.take(pa.array(index.order))
+    index = index.sorted()
+
+    lap_time_s = lap_time_to_seconds_arrow(table["LapTime"])
+    table = table.append_column("LapTime_s", lap_time_s)
+    keep = _not_missing(lap_time_s).to_numpy(zero_copy_only=False).astype(bool)
+    if not keep.all():
+        table = table.filter(pa.array(keep))
+        index = index.subset(keep)
+
+    y = table["LapTime_s"].to_numpy()
+
+    if spec.stint is not None:
+        feats = compute_stint_features(
+            index.starts("stint"),
+            pc.cast(table["LapNumber"], pa.float64()).to_numpy(),
+            y,
+            spec=spec.stint,
+        )
+        for name, values in feats.items():
+            table = table.append_column(name, _float_column(values))
+
+    for k in spec.lags:
+        table = table.append_column(f"LapTime_lag_{k}_s", _float_column(index.shift(y, k)))
+
+    target = index.shift(y, -1)
+    table = table.append_column("LapTime_next_s", _float_column(target))
+
+    keep = ~np.isnan(target)
+    return table.filter(pa.array(keep)), index.subset(keep)
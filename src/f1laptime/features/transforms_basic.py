@@ -3,8 +3,13 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Sequence
 
+import numpy as np
 import pandas as pd
 
+from f1laptime.data.contracts import LAP_SORT_COLS
+from f1laptime.features.group_index import GroupIndex
+from f1laptime.features.transforms_stint import StintFeatureSpec, add_stint_features
+
 
 @dataclass(frozen=True)
 class LapCleanSpec:
@@ -25,8 +30,10 @@ class BasicExampleSpec:
     Minimal spec for turning laps into supervised examples.
 
     We keep it small: later we can add other specs for different tasks.
+    Set `stint` to add per-stint degradation / fuel correction features.
     """
     lags: Sequence[int] = (1, 2, 3)
+    stint: StintFeatureSpec | None = None
 
 
 def _lap_time_to_seconds(series: pd.Series) -> pd.Series:
@@ -44,41 +51,52 @@ def _lap_time_to_seconds(series: pd.Series) -> pd.Series:
     return converted.dt.total_seconds()
 
 
-def clean_laps(
+def clean_laps_mask(
     laps: pd.DataFrame,
     *,
     spec: LapCleanSpec = LapCleanSpec(),
-) -> pd.DataFrame:
+) -> np.ndarray:
     """
-    Clean laps with a configurable but task-agnostic policy.
+    Boolean mask (in laps row order) of the rows clean_laps keeps.
+
+    Useful to filter row-aligned side structures (e.g. a GroupIndex) the same way.
     """
-    df = laps.copy()
+    mask = np.ones(len(laps), dtype=bool)
 
     if spec.drop_pit_laps:
         for col in ["PitInTime", "PitOutTime"]:
-            if col in df.columns:
-                df = df[df[col].isna()]
-
-    drop_cols: list[str] = []
-    if spec.drop_missing_driver and "Driver" in df.columns:
-        drop_cols.append("Driver")
-    if spec.drop_missing_lap_number and "LapNumber" in df.columns:
-        drop_cols.append("LapNumber")
-    if spec.drop_missing_lap_time and "LapTime" in df.columns:
-        drop_cols.append("LapTime")
-    if drop_cols:
-        df = df.dropna(subset=drop_cols)
+            if col in laps.columns:
+                mask &= laps[col].isna().to_numpy()
+
+    for flag, col in [
+        (spec.drop_missing_driver, "Driver"),
+        (spec.drop_missing_lap_number, "LapNumber"),
+        (spec.drop_missing_lap_time, "LapTime"),
+    ]:
+        if flag and col in laps.columns:
+            mask &= laps[col].notna().to_numpy()
 
     if spec.min_lap_time_s is not None or spec.max_lap_time_s is not None:
-        lap_time_s = _lap_time_to_seconds(df["LapTime"])
-        mask = lap_time_s.notna()
+        lap_time_s = _lap_time_to_seconds(laps["LapTime"])
+        keep = lap_time_s.notna()
         if spec.min_lap_time_s is not None:
-            mask &= lap_time_s >= spec.min_lap_time_s
+            keep &= lap_time_s >= spec.min_lap_time_s
         if spec.max_lap_time_s is not None:
-            mask &= lap_time_s <= spec.max_lap_time_s
-        df = df[mask].copy()
+            keep &= lap_time_s <= spec.max_lap_time_s
+        mask &= keep.to_numpy()
 
-    return df
+    return mask
+
+
+def clean_laps(
+    laps: pd.DataFrame,
+    *,
+    spec: LapCleanSpec = LapCleanSpec(),
+) -> pd.DataFrame:
+    """
+    Clean laps with a configurable but task-agnostic policy.
+    """
+    return laps[clean_laps_mask(laps, spec=spec)].copy()
 
 
 def clean_laps_minimal(laps: pd.DataFrame) -> pd.DataFrame:
@@ -93,11 +111,19 @@ def clean_laps_minimal(laps: pd.DataFrame) -> pd.DataFrame:
     return clean_laps(laps)
 
 
+def _check_example_spec(spec: BasicExampleSpec) -> None:
+    if len(set(spec.lags)) != len(spec.lags):
+        raise ValueError("BasicExampleSpec.lags must be unique")
+    if any(k <= 0 for k in spec.lags):
+        raise ValueError("BasicExampleSpec.lags must be positive integers")
+
+
 def build_next_lap_examples(
     laps: pd.DataFrame,
     *,
     spec: BasicExampleSpec = BasicExampleSpec(),
     clean_spec: LapCleanSpec | None = LapCleanSpec(),
+    index: GroupIndex | None = None,
 ) -> pd.DataFrame:
     """
     Produce a supervised ML table where each row predicts next lap time.
@@ -106,11 +132,14 @@ def build_next_lap_examples(
     - LapTime_s (current lap time)
     - LapTime_next_s (target)
     - Lag features: LapTime_lag_{k}_s
+    - Stint features (if spec.stint is set, see transforms_stint)
+
+    Pass a GroupIndex of laps to reuse its sort and group offsets (same output).
     """
-    if len(set(spec.lags)) != len(spec.lags):
-        raise ValueError("BasicExampleSpec.lags must be unique")
-    if any(k <= 0 for k in spec.lags):
-        raise ValueError("BasicExampleSpec.lags must be positive integers")
+    if index is not None:
+        return build_next_lap_examples_indexed(laps, index, spec=spec, clean_spec=clean_spec)[0]
+
+    _check_example_spec(spec)
 
     if clean_spec is None:
         df = laps.copy()
@@ -118,13 +147,17 @@ def build_next_lap_examples(
         df = clean_laps(laps, spec=clean_spec)
 
     # Sort by driver and lap number for temporal consistency
-    df = df.sort_values(["Year", "EventName", "Session", "Driver", "LapNumber"]).copy()
+    df = df.sort_values(list(LAP_SORT_COLS)).copy()
 
     df["LapTime_s"] = _lap_time_to_seconds(df["LapTime"])
 
     # Drop if conversion failed
     df = df.dropna(subset=["LapTime_s"]).copy()
 
+    # Stint features use the full lap sequence (before the target drops last laps)
+    if spec.stint is not None:
+        df = add_stint_features(df, spec=spec.stint, assume_sorted=True)
+
     # Group per (event, session, driver) to avoid mixing contexts
     group_cols = ["Year", "EventName", "Session", "Driver"]
     g = df.groupby(group_cols, sort=False)
@@ -140,3 +173,48 @@ def build_next_lap_examples(
     df = df.dropna(subset=["LapTime_next_s"]).copy()
 
     return df
+
+
+def build_next_lap_examples_indexed(
+    laps: pd.DataFrame,
+    index: GroupIndex,
+    *,
+    spec: BasicExampleSpec = BasicExampleSpec(),
+    clean_spec: LapCleanSpec | None = LapCleanSpec(),
+) -> tuple[pd.DataFrame, GroupIndex]:
+    """
+    build_next_lap_examples on contiguous slices of a precomputed GroupIndex.
+
+    No sort or groupby: cleaning filters the index, lags/target are grouped shifts.
+    Also returns the index of the output table (already in sorted order).
+    """
+    _check_example_spec(spec)
+
+    if clean_spec is None:
+        df = laps
+    else:
+        keep = clean_laps_mask(laps, spec=clean_spec)
+        df = laps[keep]
+        index = index.subset(keep)
+
+    df = index.take(df).copy()
+    index = index.sorted()
+
+    df["LapTime_s"] = _lap_time_to_seconds(df["LapTime"])
+    keep = df["LapTime_s"].notna().to_numpy()
+    if not keep.all():
+        df = df[keep].copy()
+        index = index.subset(keep)
+
+    if spec.stint is not None:
+        df = add_stint_features(df, spec=spec.stint, index=index)
+
+    y = df["LapTime_s"].to_numpy(dtype=float)
+    for k in spec.lags:
+        df[f"LapTime_lag_{k}_s"] = index.shift(y, k)
+
+    target = index.shift(y, -1)
+    df["LapTime_next_s"] = target
+
+    keep = ~np.isnan(target)
+    return df[keep].copy(), index.subset(keep)
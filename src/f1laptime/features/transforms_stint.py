@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from f1laptime.data.contracts import LAP_SORT_COLS, STINT_KEY_COLS
+from f1laptime.features.group_index import GroupIndex, segment_cumsum
+
+
+@dataclass(frozen=True)
+class StintFeatureSpec:
+    """
+    Per-(session, driver, Stint) tyre degradation and fuel correction features.
+
+    Fuel correction expresses every lap at the start-of-session fuel load:
+    LapTime_fuelcorr_s = LapTime_s + fuel_s_per_lap * (LapNumber - 1).
+
+    Expanding fits (suffix `_exp`) only use laps up to and including the current
+    one and are safe as forecasting inputs. Full-stint fits see the whole stint
+    (including future laps) and are meant for analysis, not as model inputs.
+    """
+    fuel_s_per_lap: float = 0.06
+    fit_fuel_corrected: bool = True
+    quadratic: bool = True
+    expanding: bool = True
+    full_stint: bool = False
+
+
+def stint_segment_starts(df: pd.DataFrame) -> np.ndarray:
+    """
+    Row positions where a new (session, driver, Stint) run starts.
+
+    df must already be sorted by LAP_SORT_COLS; a stint is a contiguous run of
+    rows sharing the same STINT_KEY_COLS values (NaN Stint counts as a value).
+    """
+    n = len(df)
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+    change = np.zeros(n, dtype=bool)
+    change[0] = True
+    for col in STINT_KEY_COLS:
+        codes, _ = pd.factorize(df[col], use_na_sentinel=True)
+        change[1:] |= codes[1:] != codes[:-1]
+    return np.flatnonzero(change)
+
+
+def _segment_sum(values: np.ndarray, starts: np.ndarray, lengths: np.ndarray, *, expanding: bool) -> np.ndarray:
+    """
+    Per-row sum of values over its segment (or over the segment prefix up to the row).
+    """
+    if expanding:
+        return segment_cumsum(values, starts)
+    return np.repeat(np.add.reduceat(values, starts), lengths)
+
+
+def _segment_first_finite(y: np.ndarray, starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """
+    First finite value of every segment (0.0 for segments without one).
+    """
+    finite = np.flatnonzero(np.isfinite(y))
+    if finite.size == 0:
+        return np.zeros(len(starts))
+    pos = np.minimum(np.searchsorted(finite, starts), finite.size - 1)
+    first = finite[pos]
+    return np.where((first >= starts) & (first < starts + lengths), y[first], 0.0)
+
+
+def _det3(a, b, c, d, e, f, g, h, i):
+    return a * (e * i - f * h) - b * (d * i - f * g) + c * (d * h - e * g)
+
+
+def _poly_fits(
+    x: np.ndarray,
+    y: np.ndarray,
+    starts: np.ndarray,
+    lengths: np.ndarray,
+    *,
+    quadratic: bool,
+    expanding: bool,
+) -> dict[str, np.ndarray]:
+    """
+    Closed-form least squares fits of y ~ x (and y ~ x + x^2) for all segments at once.
+
+    Works from segmented power sums, so there is no per-stint Python loop. Rows with
+    non-finite y are ignored by the fits. Underdetermined fits are NaN.
+    """
+    w = np.isfinite(y).astype(float)
+    # Center each segment on its first finite y for numerical headroom (it cancels
+    # in the fit); a per-segment constant keeps every fit independent of other rows.
+    y0 = np.repeat(_segment_first_finite(y, starts, lengths), lengths)
+    yc = np.where(w > 0, y - y0, 0.0)
+    x = x.astype(float)
+
+    def seg(v: np.ndarray) -> np.ndarray:
+        return _segment_sum(v, starts, lengths, expanding=expanding)
+
+    s0, s1, s2 = seg(w), seg(w * x), seg(w * x * x)
+    t0, t1 = seg(yc), seg(yc * x)
+
+    out: dict[str, np.ndarray] = {}
+    with np.errstate(divide="ignore", invalid="ignore"):
+        det = s0 * s2 - s1 * s1
+        ok = det > 1e-9 * np.maximum(s0 * s2, 1.0)
+        slope = np.where(ok, (s0 * t1 - s1 * t0) / det, np.nan)
+        intercept = (t0 - slope * s1) / s0 + y0
+        out["lin_slope"] = slope
+        out["lin_resid"] = y - (intercept + slope * x)
+
+        if quadratic:
+            s3, s4 = seg(w * x**3), seg(w * x**4)
+            t2 = seg(yc * x * x)
+            det = _det3(s0, s1, s2, s1, s2, s3, s2, s3, s4)
+            ok = det > 1e-9 * np.maximum(s0 * s2 * s4, 1.0)
+            c0 = _det3(t0, s1, s2, t1, s2, s3, t2, s3, s4) / det
+            c1 = _det3(s0, t0, s2, s1, t1, s3, s2, t2, s4) / det
+            c2 = _det3(s0, s1, t0, s1, s2, t1, s2, s3, t2) / det
+            c0, c1, c2 = (np.where(ok, c, np.nan) for c in (c0, c1, c2))
+            out["quad_slope"] = c1
+            out["quad_curv"] = c2
+            out["quad_resid"] = y - (c0 + y0 + c1 * x + c2 * x * x)
+    return out
+
+
+def compute_stint_features(
+    starts: np.ndarray,
+    lap_number: np.ndarray,
+    lap_time_s: np.ndarray,
+    *,
+    spec: StintFeatureSpec = StintFeatureSpec(),
+) -> dict[str, np.ndarray]:
+    """
+    Array-level stint features for rows already grouped into contiguous stints.
+
+    starts are the segment start positions (see stint_segment_starts).
+    """
+    n = len(lap_number)
+    lap_number = np.asarray(lap_number, dtype=float)
+    lap_time_s = np.asarray(lap_time_s, dtype=float)
+    lengths = np.diff(np.append(starts, n))
+
+    stint_lap = lap_number - np.repeat(lap_number[starts], lengths)
+    fuelcorr = lap_time_s + spec.fuel_s_per_lap * (lap_number - 1.0)
+    y = fuelcorr if spec.fit_fuel_corrected else lap_time_s
+
+    out: dict[str, np.ndarray] = {
+        "StintLap": stint_lap,
+        "LapTime_fuelcorr_s": fuelcorr,
+    }
+    if n == 0:
+        return out
+
+    variants = []
+    if spec.full_stint:
+        variants.append(("", False))
+    if spec.expanding:
+        variants.append(("_exp", True))
+    for suffix, expanding in variants:
+        fits = _poly_fits(stint_lap, y, starts, lengths, quadratic=spec.quadratic, expanding=expanding)
+        for name, values in fits.items():
+            out[f"StintDeg_{name}{suffix}_s"] = values
+    return out
+
+
+def add_stint_features(
+    laps: pd.DataFrame,
+    *,
+    spec: StintFeatureSpec = StintFeatureSpec(),
+    assume_sorted: bool = False,
+    index: GroupIndex | None = None,
+) -> pd.DataFrame:
+    """
+    Add stint degradation / fuel correction columns to a laps table.
+
+    Requires LapTime_s (float seconds). Returns a copy sorted by LAP_SORT_COLS
+    (pass assume_sorted=True to skip the sort when the input already is).
+    With a GroupIndex of laps, its order and stint offsets are reused instead.
+    """
+    missing = [c for c in (*STINT_KEY_COLS, "LapNumber", "LapTime_s") if c not in laps.columns]
+    if missing:
+        raise ValueError(f"add_stint_features: missing required columns: {missing}")
+
+    if index is not None:
+        df = index.take(laps).copy()
+        starts = index.starts("stint")
+    else:
+        df = laps.copy() if assume_sorted else laps.sort_values(list(LAP_SORT_COLS)).copy()
+        starts = stint_segment_starts(df)
+    feats = compute_stint_features(
+        starts,
+        df["LapNumber"].to_numpy(dtype=float, na_value=np.nan),
+        df["LapTime_s"].to_numpy(dtype=float, na_value=np.nan),
+        spec=spec,
+    )
+    for name, values in feats.items():
+        df[name] = values
+    return df
@@ -18,3 +18,8 @@ DATA_DIR: Path = Path(os.environ.get("F1LTF_DATA_DIR", PROJECT_ROOT / "data"))
 FASTF1_CACHE_DIR: Path = Path(
     os.environ.get("FASTF1_CACHE_DIR", DATA_DIR / "cache" / "fastf1")
 )
+
+# Lazily materialized feature columns (see f1laptime.features.store)
+FEATURE_STORE_DIR: Path = Path(
+    os.environ.get("F1LTF_FEATURE_STORE_DIR", DATA_DIR / "features")
+)
@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from f1laptime.data.dataset_build import build_examples_chunked
+from f1laptime.data.summaries import merge_summaries, read_summary_sidecar, summary_sidecar_path
+from f1laptime.features.group_index import load_group_index
+from f1laptime.features.transforms_basic import BasicExampleSpec, build_next_lap_examples
+from f1laptime.features.transforms_stint import StintFeatureSpec
+
+
+def _laps(year: int, event: str, n_laps: int, *, stint_laps: int | None = None, noise_s: float = 0.0, seed: int = 0):
+    # One race, two drivers; LapTime = 90 s + 0.1 s per lap (+ noise)
+    rng = np.random.default_rng(seed)
+    lap = np.tile(np.arange(1, n_laps + 1, dtype=float), 2)
+    stint = 1.0 + (lap - 1) // stint_laps if stint_laps else np.ones_like(lap)
+    return pd.DataFrame(
+        {
+            "Year": year,
+            "EventName": event,
+            "Session": "R",
+            "Driver": np.repeat(["BBB", "AAA"], n_laps),
+            "LapNumber": lap,
+            "Stint": stint,
+            "Compound": np.where(stint == 1, "SOFT", "HARD"),
+            "LapTime": pd.to_timedelta(90.0 + 0.1 * (lap - 1) + rng.normal(0.0, noise_s, lap.size), unit="s"),
+            "PitInTime": pd.NaT,
+            "PitOutTime": pd.NaT,
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [BasicExampleSpec(), BasicExampleSpec(lags=(1, 2), stint=StintFeatureSpec(fuel_s_per_lap=0.05, full_stint=True))],
+)
+def test_build_examples_chunked_matches_in_memory(tmp_path, spec):
+    sessions = [(2024, "Jeddah", 11), (2023, "Monza", 9), (2024, "Bahrain", 13)]
+    frames = []
+    for i, (year, event, n_laps) in enumerate(sessions):
+        laps = _laps(year, event, n_laps, stint_laps=5, noise_s=0.3, seed=i)
+        laps.to_parquet(tmp_path / f"laps_year={year}_event={event}_session=R.parquet", index=False)
+        frames.append(laps)
+
+    # Compare after a parquet round trip, like the output (index dropped, same dtypes)
+    expected_path = tmp_path / "expected.parquet"
+    build_next_lap_examples(pd.concat(frames, ignore_index=True), spec=spec).to_parquet(expected_path, index=False)
+    expected = pd.read_parquet(expected_path)
+
+    # Identical, not just close: every feature depends only on its own session
+    for sessions_per_chunk in (1, 2):
+        out_path = tmp_path / f"examples_chunk{sessions_per_chunk}.parquet"
+        build_examples_chunked(tmp_path, out_path, examples_spec=spec, sessions_per_chunk=sessions_per_chunk)
+        pd.testing.assert_frame_equal(pd.read_parquet(out_path), expected, check_exact=True)
+
+    merged = merge_summaries(read_summary_sidecar(summary_sidecar_path(out_path)))
+    assert merged[()]["LapTime_s"].count == len(expected)
+
+
+def test_build_examples_chunked_handles_all_missing_columns(tmp_path):
+    # The first session has no compound info at all: parquet stores that column as null
+    frames = [_laps(2023, "Monza", 4), _laps(2024, "Bahrain", 5)]
+    frames[0]["Compound"] = None
+    for laps, (year, event) in zip(frames, [(2023, "Monza"), (2024, "Bahrain")]):
+        laps.to_parquet(tmp_path / f"laps_year={year}_event={event}_session=R.parquet", index=False)
+
+    expected_path = tmp_path / "expected.parquet"
+    build_next_lap_examples(pd.concat(frames, ignore_index=True)).to_parquet(expected_path, index=False)
+
+    out_path = tmp_path / "examples.parquet"
+    build_examples_chunked(tmp_path, out_path)
+    pd.testing.assert_frame_equal(pd.read_parquet(out_path), pd.read_parquet(expected_path))
+
+
+def test_build_for_session_backends_write_identical_files(tmp_path, monkeypatch):
+    import f1laptime.data.dataset_build as dataset_build
+    from f1laptime.data.fastf1_loader import SessionSpec
+
+    laps = _laps(2024, "Bahrain", 6)
+    monkeypatch.setattr(dataset_build, "load_session", lambda spec, **kwargs: None)
+    monkeypatch.setattr(dataset_build, "extract_laps_table", lambda session, **kwargs: laps.copy())
+
+    spec = SessionSpec(year=2024, event_name="Bahrain", session="R")
+    outputs = {}
+    for backend in ("pandas", "arrow"):
+        paths = dataset_build.BuildPaths(
+            interim_dir=tmp_path / backend / "interim",
+            processed_dir=tmp_path / backend / "processed",
+        )
+        outputs[backend] = dataset_build.build_for_session(spec, paths=paths, backend=backend)
+
+    for attr in ("clean_laps_path", "examples_path"):
+        pd.testing.assert_frame_equal(
+            pd.read_parquet(getattr(outputs["pandas"], attr)),
+            pd.read_parquet(getattr(outputs["arrow"], attr)),
+        )
+
+    # Group indexes are persisted next to each artifact and stay row-aligned
+    for backend, artifacts in outputs.items():
+        for path in (artifacts.laps_path, artifacts.clean_laps_path, artifacts.examples_path):
+            index = load_group_index(path)
+            assert index is not None
+            assert index.n_rows == len(pd.read_parquet(path))
+        assert load_group_index(artifacts.examples_path).is_sorted
@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from f1laptime.features.group_index import build_group_index
+from f1laptime.features.registry import FeatureDef, FeatureRegistry, default_registry
+from f1laptime.features.store import FeatureStore
+from f1laptime.features.transforms_basic import BasicExampleSpec, build_next_lap_examples
+
+
+def _laps(event: str = "Bahrain", noise_s: float = 0.0) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    lap = np.tile(np.arange(1, 9, dtype=float), 2)
+    return pd.DataFrame(
+        {
+            "Year": 2024,
+            "EventName": event,
+            "Session": "R",
+            "Driver": np.repeat(["AAA", "BBB"], 8),
+            "LapNumber": lap,
+            "Stint": 1.0,
+            "Compound": "SOFT",
+            "LapTime": pd.to_timedelta(90.0 + 0.1 * (lap - 1) + rng.normal(0.0, noise_s, lap.size), unit="s"),
+            "PitInTime": pd.NaT,
+            "PitOutTime": pd.NaT,
+        }
+    )
+
+
+def _write_examples(path, laps: pd.DataFrame) -> None:
+    build_next_lap_examples(laps, spec=BasicExampleSpec(lags=(1,))).to_parquet(path, index=False)
+
+
+def test_store_matches_example_builder_and_memoizes(tmp_path):
+    base = tmp_path / "examples_next_lap_year=2024_event=Bahrain_session=R.parquet"
+    laps = _laps(noise_s=0.5)
+    _write_examples(base, laps)
+    store = FeatureStore(tmp_path / "store", registry=default_registry())
+
+    df = store.load(base, ["LapTime_lag_3_s", "LapTime_diff_1_s"])
+    expected = build_next_lap_examples(laps, spec=BasicExampleSpec(lags=(1, 3))).reset_index(drop=True)
+    pd.testing.assert_series_equal(df["LapTime_lag_3_s"], expected["LapTime_lag_3_s"])
+    np.testing.assert_allclose(df["LapTime_diff_1_s"], expected["LapTime_s"] - expected["LapTime_lag_1_s"])
+
+    # LapTime_lag_1_s is a base column here, so it is read rather than computed
+    assert not (store.partition_dir(base) / "LapTime_lag_1_s.parquet").exists()
+
+    stats = store.materialize([base], ["LapTime_lag_3_s", "LapTime_diff_1_s"])
+    assert stats.computed == {}
+    assert stats.cached == {"LapTime_lag_3_s": 1, "LapTime_diff_1_s": 1}
+
+
+def test_grouped_features_follow_row_order(tmp_path):
+    # Rows in any order: lags must still come from the same driver's earlier laps
+    examples = build_next_lap_examples(_laps(noise_s=0.5))
+    shuffled = examples.sort_values("LapTime_s", ascending=False).reset_index(drop=True)
+    ordered = shuffled.sort_values(["Year", "EventName", "Session", "Driver", "LapNumber"])
+    expected = ordered.groupby(["Year", "EventName", "Session", "Driver"])["LapTime_s"].shift(2)
+    expected = expected.reindex(shuffled.index).to_numpy()
+
+    lag_2 = default_registry()["LapTime_lag_2_s"].compute
+    np.testing.assert_array_equal(lag_2(shuffled, build_group_index(shuffled)), expected)
+
+    base = tmp_path / "examples_shuffled.parquet"
+    shuffled.to_parquet(base, index=False)
+    df = FeatureStore(tmp_path / "store").load(base, ["LapTime_lag_2_s"])
+    np.testing.assert_array_equal(df["LapTime_lag_2_s"].to_numpy(), expected)
+
+
+def test_only_changed_features_are_recomputed(tmp_path):
+    bases = [tmp_path / f"examples_{e}.parquet" for e in ("A", "B")]
+    for base, event in zip(bases, ("A", "B")):
+        _write_examples(base, _laps(event))
+
+    def make_registry(version: int) -> FeatureRegistry:
+        reg = FeatureRegistry()
+        reg.register(FeatureDef("Double_s", version, ("LapTime_s",), lambda df, index: df["LapTime_s"] * 2))
+        reg.register(FeatureDef("Plus1_s", 1, ("Double_s",), lambda df, index: df["Double_s"] + 1))
+        reg.register(FeatureDef("Other_s", 1, ("LapTime_s",), lambda df, index: df["LapTime_s"] - 1))
+        return reg
+
+    store = FeatureStore(tmp_path / "store", registry=make_registry(1))
+    first = store.materialize(bases, ["Plus1_s", "Other_s"])
+    assert first.computed == {"Double_s": 2, "Plus1_s": 2, "Other_s": 2}
+
+    # Adding a feature computes just that column
+    store.registry.register(FeatureDef("New_s", 1, ("LapTime_s",), lambda df, index: df["LapTime_s"] * 0))
+    added = store.materialize(bases, ["Plus1_s", "Other_s", "New_s"])
+    assert added.computed == {"New_s": 2}
+
+    # Bumping a version invalidates the feature and its dependents only
+    store = FeatureStore(tmp_path / "store", registry=make_registry(2))
+    bumped = store.materialize(bases, ["Plus1_s", "Other_s"])
+    assert bumped.computed == {"Double_s": 2, "Plus1_s": 2}
+    assert bumped.cached == {"Other_s": 2}
+
+
+def test_registry_rejects_cycles():
+    reg = FeatureRegistry()
+    reg.register(FeatureDef("a", 1, ("b",), lambda df, index: df["b"]))
+    reg.register(FeatureDef("b", 1, ("a",), lambda df, index: df["a"]))
+    with pytest.raises(ValueError, match="cycle"):
+        reg.resolve(["a"])
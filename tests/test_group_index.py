@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+
+from f1laptime.data.contracts import LAP_SORT_COLS
+from f1laptime.features.group_index import build_group_index, load_group_index, save_group_index
+from f1laptime.features.transforms_basic import BasicExampleSpec, LapCleanSpec, build_next_lap_examples
+from f1laptime.features.transforms_stint import StintFeatureSpec
+
+
+def _laps() -> pd.DataFrame:
+    # Three sessions x three drivers x two 6-lap stints with pit laps, rows shuffled
+    rng = np.random.default_rng(0)
+    lap = np.tile(np.arange(1, 13, dtype=float), 9)
+    stint = 1.0 + (lap - 1) // 6
+    df = pd.DataFrame(
+        {
+            "Year": np.repeat([2024, 2023, 2024], 36),
+            "EventName": np.repeat(["Jeddah", "Bahrain", "Bahrain"], 36),
+            "Session": "R",
+            "Driver": np.tile(np.repeat(["CCC", "AAA", "BBB"], 12), 3),
+            "LapNumber": lap,
+            "Stint": stint,
+            "Compound": np.where(stint == 1, "SOFT", "HARD"),
+            "LapTime": pd.to_timedelta(90.0 + 0.1 * (lap - 1) + rng.normal(0.0, 1.0, lap.size), unit="s"),
+            "PitInTime": pd.to_timedelta(np.where(lap == 6, lap, np.nan), unit="min"),
+            "PitOutTime": pd.to_timedelta(np.where(lap == 7, lap, np.nan), unit="min"),
+        }
+    ).sample(frac=1.0, random_state=0)
+    df.iloc[4, df.columns.get_loc("LapTime")] = pd.NaT
+    return df
+
+
+def test_order_and_offsets_match_pandas_grouping():
+    df = _laps()
+    index = build_group_index(df)
+
+    expected = df.sort_values(list(LAP_SORT_COLS))
+    assert np.array_equal(df.index.to_numpy()[index.order], expected.index.to_numpy())
+    assert len(index.session_offsets) - 1 == 3
+    assert len(index.driver_offsets) - 1 == 9
+    assert len(index.stint_offsets) - 1 == 18
+    assert np.all(index.lengths("driver") == 12)
+
+
+def test_subset_matches_rebuilt_index():
+    df = _laps()
+    keep = df["PitInTime"].isna().to_numpy() & (df["Driver"] != "BBB").to_numpy()
+    sub = build_group_index(df).subset(keep)
+    rebuilt = build_group_index(df[keep])
+    for attr in ("order", "session_offsets", "driver_offsets", "stint_offsets"):
+        assert np.array_equal(getattr(sub, attr), getattr(rebuilt, attr))
+
+
+def test_is_sorted_follows_the_table_order():
+    df = _laps()
+    index = build_group_index(df)
+    assert not index.is_sorted
+    assert index.sorted().is_sorted
+    assert build_group_index(index.take(df)).is_sorted
+
+    keep = df["PitInTime"].isna().to_numpy()
+    assert index.sorted().subset(keep[index.order]).is_sorted
+
+
+def test_grouped_kernels_match_pandas_groupby():
+    df = _laps().sort_values(list(LAP_SORT_COLS))
+    df["LapTime_s"] = df["LapTime"].dt.total_seconds()
+    index = build_group_index(df)
+    y = df["LapTime_s"].to_numpy()
+    g = df.groupby(["Year", "EventName", "Session", "Driver"], sort=False)["LapTime_s"]
+
+    np.testing.assert_array_equal(index.shift(y, 2), g.shift(2).to_numpy())
+    np.testing.assert_array_equal(index.shift(y, -1), g.shift(-1).to_numpy())
+    roll = g.rolling(3, min_periods=1)
+    np.testing.assert_allclose(index.rolling_mean(y, 3), roll.mean().droplevel([0, 1, 2, 3]).reindex(df.index))
+    np.testing.assert_allclose(
+        index.rolling_std(y, 3),
+        g.rolling(3, min_periods=2).std().droplevel([0, 1, 2, 3]).reindex(df.index),
+    )
+    np.testing.assert_allclose(index.reduce(y, how="mean"), g.mean().to_numpy())
+
+
+def test_examples_with_index_match_default_path():
+    df = _laps()
+    spec = BasicExampleSpec(lags=(1, 2), stint=StintFeatureSpec(full_stint=True))
+    clean_spec = LapCleanSpec(min_lap_time_s=88.5)
+    expected = build_next_lap_examples(df, spec=spec, clean_spec=clean_spec)
+    got = build_next_lap_examples(df, spec=spec, clean_spec=clean_spec, index=build_group_index(df))
+    pd.testing.assert_frame_equal(got, expected)
+
+
+def test_index_round_trip_next_to_parquet(tmp_path):
+    df = _laps()
+    path = tmp_path / "laps.parquet"
+    df.to_parquet(path, index=False)
+    index = build_group_index(df)
+    save_group_index(index, path)
+
+    loaded = load_group_index(path)
+    assert np.array_equal(loaded.order, index.order)
+    assert np.array_equal(loaded.stint_offsets, index.stint_offsets)
+
+    # A rewritten table invalidates the index, even with the same row count
+    df.iloc[::-1].to_parquet(path, index=False)
+    assert load_group_index(path) is None
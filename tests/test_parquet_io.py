@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from f1laptime.data.contracts import LAP_SORT_COLS
+from f1laptime.data.parquet_io import (
+    ParquetAppender,
+    WriteProfile,
+    read_laps,
+    read_sort_order,
+    write_parquet,
+)
+
+
+def _laps() -> pd.DataFrame:
+    # Two sessions x 20 drivers x 50 laps, rows shuffled
+    rng = np.random.default_rng(0)
+    n = 2 * 20 * 50
+    df = pd.DataFrame(
+        {
+            "Year": np.repeat([2023, 2024], n // 2),
+            "EventName": np.repeat(["Monza", "Bahrain"], n // 2),
+            "Session": "R",
+            "Driver": np.tile(np.repeat([f"D{d:02d}" for d in range(20)], 50), 2),
+            "LapNumber": np.tile(np.arange(1, 51, dtype=float), 40),
+            "Compound": "SOFT",
+            "LapTime_s": 90.0 + rng.normal(0.0, 1.0, n),
+        }
+    )
+    return df.sample(frac=1.0, random_state=0).reset_index(drop=True)
+
+
+def test_write_parquet_sorts_and_records_order(tmp_path):
+    df = _laps()
+    path = write_parquet(df, tmp_path / "laps.parquet", profile="small")
+
+    out = pd.read_parquet(path)
+    expected = df.sort_values(list(LAP_SORT_COLS), kind="mergesort").reset_index(drop=True)
+    pd.testing.assert_frame_equal(out, expected)
+
+    assert read_sort_order(path) == LAP_SORT_COLS
+    meta = pq.ParquetFile(path).metadata.row_group(0)
+    assert [c.column_index for c in meta.sorting_columns] == [out.columns.get_loc(c) for c in LAP_SORT_COLS]
+    assert meta.column(out.columns.get_loc("Driver")).compression == "ZSTD"
+
+
+def test_write_parquet_without_keys_keeps_row_order(tmp_path):
+    df = pd.DataFrame({"x": [3.0, 1.0, 2.0]})
+    path = write_parquet(df, tmp_path / "col.parquet")
+    pd.testing.assert_frame_equal(pd.read_parquet(path), df)
+    assert read_sort_order(path) == ()
+
+
+def test_selective_read_skips_row_groups(tmp_path):
+    df = _laps()
+    profile = WriteProfile(name="tiny", compression="snappy", compression_level=None, row_group_size=100, data_page_size=4096)
+    path = write_parquet(df, tmp_path / "laps.parquet", profile=profile)
+
+    # Each driver's session spans one row group boundary at most
+    out = read_laps(path, year=2024, event_name="Bahrain", session="R", driver="D07")
+    assert len(out) == 50
+    assert out["LapNumber"].is_monotonic_increasing
+
+    pf = pq.ParquetFile(path)
+    driver_col = pf.schema_arrow.get_field_index("Driver")
+    year_col = pf.schema_arrow.get_field_index("Year")
+    hits = 0
+    for i in range(pf.num_row_groups):
+        stats = pf.metadata.row_group(i)
+        d, y = stats.column(driver_col).statistics, stats.column(year_col).statistics
+        if d.min <= "D07" <= d.max and y.min <= 2024 <= y.max:
+            hits += 1
+    assert hits <= 2 < pf.num_row_groups
+
+
+def test_appender_matches_single_write(tmp_path):
+    df = _laps().sort_values(list(LAP_SORT_COLS), kind="mergesort").reset_index(drop=True)
+    with ParquetAppender(tmp_path / "chunked.parquet", profile="fast") as writer:
+        for _, chunk in df.groupby("Year", sort=True):
+            writer.write(chunk)
+
+    pd.testing.assert_frame_equal(pd.read_parquet(tmp_path / "chunked.parquet"), df)
+    assert read_sort_order(tmp_path / "chunked.parquet") == LAP_SORT_COLS
+
+
+def test_unknown_profile_raises(tmp_path):
+    with pytest.raises(ValueError, match="Unknown write profile"):
+        write_parquet(_laps(), tmp_path / "x.parquet", profile="tiny")
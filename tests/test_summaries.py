@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+
+from f1laptime.data.summaries import (
+    ColumnSummary,
+    merge_summaries,
+    read_summary_sidecar,
+    summarize_frame,
+    write_summary_sidecar,
+)
+
+
+def _examples(n: int, event: str, compound: str, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    lap_s = 90.0 + rng.normal(0.0, 1.5, size=n)
+    return pd.DataFrame(
+        {
+            "Year": [2024] * n,
+            "EventName": [event] * n,
+            "Session": ["R"] * n,
+            "Compound": [compound] * n,
+            "LapTime_s": lap_s,
+            "LapTime_next_s": np.roll(lap_s, -1),
+        }
+    )
+
+
+def test_column_summary_merge_matches_whole():
+    rng = np.random.default_rng(0)
+    values = 90.0 + rng.normal(0.0, 2.0, size=1000)
+    whole = ColumnSummary.from_values(values)
+    merged = ColumnSummary.from_values(values[:300]).merge(ColumnSummary.from_values(values[300:]))
+
+    assert merged.count == whole.count
+    assert np.isclose(merged.mean, whole.mean)
+    assert np.isclose(merged.var, np.var(values, ddof=1))
+    assert merged.min == values.min() and merged.max == values.max()
+
+    est = merged.quantiles([0.1, 0.5, 0.9])
+    exact = np.quantile(values, [0.1, 0.5, 0.9])
+    assert np.allclose(est, exact, rtol=0.02)
+
+
+def test_summarize_frame_counts_nulls_and_outliers():
+    df = _examples(10, "Bahrain", "SOFT", seed=1)
+    df.loc[0, "LapTime_s"] = np.nan
+    df.loc[1, "LapTime_next_s"] = df.loc[1, "LapTime_s"] + 45.0
+
+    (part,) = summarize_frame(df)
+    assert part.keys == {"Year": 2024, "EventName": "Bahrain", "Session": "R", "Compound": "SOFT"}
+    assert part.columns["LapTime_s"].null_count == 1
+    assert part.columns["LapTime_delta_s"].outlier_count == 1
+
+
+def test_slow_laps_are_outliers():
+    df = _examples(20, "Bahrain", "SOFT", seed=5)
+    df.loc[3, "LapTime_s"] = 120.0  # pit or safety-car lap in a ~90 s session
+
+    (part,) = summarize_frame(df)
+    assert part.columns["LapTime_s"].outlier_count == 1
+    assert part.columns["LapTime_next_s"].outlier_count == 0
+
+
+def test_sidecar_round_trip_and_merge_by_compound(tmp_path):
+    df = pd.concat(
+        [
+            _examples(50, "Bahrain", "SOFT", seed=2),
+            _examples(40, "Bahrain", "HARD", seed=3),
+            _examples(30, "Jeddah", "SOFT", seed=4),
+        ],
+        ignore_index=True,
+    )
+    parquet_path = tmp_path / "examples_next_lap_year=2024.parquet"
+    sidecar = write_summary_sidecar(df, parquet_path)
+    parts = read_summary_sidecar(sidecar)
+    assert len(parts) == 3
+
+    by_compound = merge_summaries(parts, by=("Compound",))
+    assert by_compound[("SOFT",)]["LapTime_s"].count == 80
+    assert by_compound[("HARD",)]["LapTime_s"].count == 40
+
+    overall = merge_summaries(parts)[()]["LapTime_s"]
+    assert overall.count == len(df)
+    assert np.isclose(overall.mean, df["LapTime_s"].mean())
+    assert np.isclose(overall.std, df["LapTime_s"].std())
+
+
+def test_empty_frame_has_no_partitions(tmp_path):
+    empty = _examples(0, "Bahrain", "SOFT", seed=0)
+    assert summarize_frame(empty) == []
+
+    # An empty session's sidecar must not break merging by key
+    write_summary_sidecar(empty, tmp_path / "empty.parquet")
+    write_summary_sidecar(_examples(10, "Jeddah", "SOFT", seed=1), tmp_path / "full.parquet")
+    parts = read_summary_sidecar(tmp_path / "empty.summary.json") + read_summary_sidecar(tmp_path / "full.summary.json")
+    assert merge_summaries(parts, by=("Compound",))[("SOFT",)]["LapTime_s"].count == 10
@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from f1laptime.features.transforms_arrow import (
+    build_next_lap_examples_arrow,
+    clean_laps_arrow,
+    lap_time_to_seconds_arrow,
+)
+from f1laptime.features.transforms_basic import (
+    BasicExampleSpec,
+    LapCleanSpec,
+    _lap_time_to_seconds,
+    build_next_lap_examples,
+    clean_laps,
+)
+from f1laptime.features.transforms_stint import StintFeatureSpec
+
+
+def _laps() -> pd.DataFrame:
+    # Two sessions, two 4-lap stints per driver with pit laps, rows shuffled
+    rng = np.random.default_rng(1)
+    lap = np.tile(np.arange(1, 9, dtype=float), 4)
+    stint = 1.0 + (lap - 1) // 4
+    df = pd.DataFrame(
+        {
+            "Year": 2024,
+            "EventName": np.repeat(["Jeddah", "Bahrain"], 16),
+            "Session": "R",
+            "Driver": np.tile(np.repeat(["BBB", "AAA"], 8), 2),
+            "LapNumber": lap,
+            "Stint": stint,
+            "Compound": np.where(stint == 1, "SOFT", "HARD"),
+            "LapTime": pd.to_timedelta(90.0 + 0.1 * (lap - 1) + rng.normal(0.0, 1.0, lap.size), unit="s"),
+            "PitInTime": pd.to_timedelta(np.where(lap == 4, lap, np.nan), unit="min"),
+            "PitOutTime": pd.to_timedelta(np.where(lap == 5, lap, np.nan), unit="min"),
+        }
+    ).sample(frac=1.0, random_state=1)
+    df.iloc[3, df.columns.get_loc("LapTime")] = pd.NaT
+    df.iloc[5, df.columns.get_loc("Compound")] = None
+    return df
+
+
+def _assert_same_parquet(pandas_out: pd.DataFrame, arrow_out: pa.Table, tmp_path) -> None:
+    pandas_out.to_parquet(tmp_path / "pandas.parquet", index=False)
+    pq.write_table(arrow_out, tmp_path / "arrow.parquet")
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(tmp_path / "pandas.parquet"),
+        pd.read_parquet(tmp_path / "arrow.parquet"),
+    )
+
+
+def test_lap_time_to_seconds_arrow_matches_pandas():
+    s = pd.Series(pd.to_timedelta([90.123456789, None, 88.5], unit="s"))
+    got = lap_time_to_seconds_arrow(pa.array(s)).to_numpy(zero_copy_only=False)
+    np.testing.assert_array_equal(got, _lap_time_to_seconds(s).to_numpy())
+
+
+def test_clean_laps_arrow_matches_pandas(tmp_path):
+    laps = _laps()
+    spec = LapCleanSpec(min_lap_time_s=89.0, max_lap_time_s=91.0)
+    _assert_same_parquet(
+        clean_laps(laps, spec=spec),
+        clean_laps_arrow(pa.Table.from_pandas(laps, preserve_index=False), spec=spec),
+        tmp_path,
+    )
+
+
+def test_build_next_lap_examples_arrow_matches_pandas(tmp_path):
+    laps = _laps()
+    table = pa.Table.from_pandas(laps, preserve_index=False)
+    for spec in [BasicExampleSpec(), BasicExampleSpec(lags=(1, 5), stint=StintFeatureSpec(full_stint=True))]:
+        _assert_same_parquet(
+            build_next_lap_examples(laps, spec=spec),
+            build_next_lap_examples_arrow(table, spec=spec),
+            tmp_path,
+        )
@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+
+from f1laptime.features.transforms_basic import BasicExampleSpec, build_next_lap_examples
+from f1laptime.features.transforms_stint import StintFeatureSpec, add_stint_features
+
+
+def _laps(
+    n_laps: int,
+    *,
+    events: tuple[str, ...] = ("Bahrain",),
+    drivers: tuple[str, ...] = ("AAA", "BBB"),
+    stint_laps: int | None = None,
+    noise_s: float = 0.0,
+    shuffle: bool = False,
+) -> pd.DataFrame:
+    # LapTime = 90 s + 0.1 s per lap (+ noise); stints of stint_laps laps
+    rng = np.random.default_rng(0)
+    lap = np.tile(np.arange(1, n_laps + 1, dtype=float), len(events) * len(drivers))
+    stint = 1.0 + (lap - 1) // stint_laps if stint_laps else np.ones_like(lap)
+    df = pd.DataFrame(
+        {
+            "Year": 2024,
+            "EventName": np.repeat(list(events), len(drivers) * n_laps),
+            "Session": "R",
+            "Driver": np.tile(np.repeat(list(drivers), n_laps), len(events)),
+            "LapNumber": lap,
+            "Stint": stint,
+            "Compound": np.where(stint == 1, "SOFT", "HARD"),
+            "LapTime": pd.to_timedelta(90.0 + 0.1 * (lap - 1) + rng.normal(0.0, noise_s, lap.size), unit="s"),
+            "PitInTime": pd.NaT,
+            "PitOutTime": pd.NaT,
+        }
+    )
+    return df.sample(frac=1.0, random_state=0) if shuffle else df
+
+
+def _stint_laps(laps: pd.DataFrame) -> pd.DataFrame:
+    laps = laps.copy()
+    laps["LapTime_s"] = laps["LapTime"].dt.total_seconds()
+    return laps.drop(columns=["LapTime"])
+
+
+def test_linear_stint_has_exact_slope_and_zero_residuals():
+    df = add_stint_features(
+        _stint_laps(_laps(6, drivers=("AAA",), shuffle=True)),
+        spec=StintFeatureSpec(fit_fuel_corrected=False, full_stint=True),
+    )
+
+    assert np.allclose(df["StintDeg_lin_slope_s"], 0.1)
+    assert np.allclose(df["StintDeg_lin_resid_s"], 0.0, atol=1e-9)
+    assert np.allclose(df["StintDeg_quad_curv_s"], 0.0, atol=1e-9)
+    assert df["StintLap"].tolist() == [0, 1, 2, 3, 4, 5]
+
+    # Expanding fits are undefined until enough laps have been seen
+    assert np.isnan(df["StintDeg_lin_slope_exp_s"].iloc[0])
+    assert np.allclose(df["StintDeg_lin_slope_exp_s"].iloc[1:], 0.1)
+    assert df["StintDeg_quad_curv_exp_s"].iloc[:2].isna().all()
+
+
+def test_fits_match_polyfit_per_stint_and_are_causal():
+    rng = np.random.default_rng(0)
+    laps = _stint_laps(_laps(21, stint_laps=12, shuffle=True))
+    stint_lap = laps.sort_values("LapNumber").groupby(["Driver", "Stint"]).cumcount()
+    laps["LapTime_s"] = 90.0 + 0.05 * stint_lap**2 + rng.normal(0, 0.2, len(laps))
+    spec = StintFeatureSpec(full_stint=True)
+    df = add_stint_features(laps, spec=spec)
+
+    for _, part in df.groupby(["Driver", "Stint"]):
+        x = part["StintLap"].to_numpy()
+        y = part["LapTime_fuelcorr_s"].to_numpy()
+        c2, c1, _ = np.polyfit(x, y, 2)
+        assert np.allclose(part["StintDeg_quad_curv_s"], c2)
+        assert np.allclose(part["StintDeg_quad_slope_s"], c1)
+        slope, _ = np.polyfit(x, y, 1)
+        assert np.allclose(part["StintDeg_lin_slope_s"], slope)
+
+        # Expanding value at row i equals a fit on laps 0..i only
+        i = 5
+        c2_i, _, _ = np.polyfit(x[: i + 1], y[: i + 1], 2)
+        assert np.isclose(part["StintDeg_quad_curv_exp_s"].iloc[i], c2_i)
+
+
+def test_examples_include_stint_features_when_requested():
+    laps = _laps(4, drivers=("AAA",))
+    ex = build_next_lap_examples(laps, spec=BasicExampleSpec(stint=StintFeatureSpec()))
+    assert "LapTime_fuelcorr_s" in ex.columns
+    assert "StintDeg_lin_slope_exp_s" in ex.columns
+    assert "StintDeg_lin_slope_s" not in ex.columns  # full-stint fits are opt-in
+    assert ex["LapNumber"].max() == 3
+
+
+def test_stint_features_do_not_depend_on_other_rows():
+    laps = _stint_laps(_laps(30, events=("Monza", "Bahrain"), stint_laps=11, noise_s=0.3))
+    spec = StintFeatureSpec(full_stint=True)
+    together = add_stint_features(laps, spec=spec)
+    alone = add_stint_features(laps[laps["EventName"] == "Bahrain"], spec=spec)
+    pd.testing.assert_frame_equal(together[together["EventName"] == "Bahrain"], alone, check_exact=True)